@@ -1,14 +1,40 @@
 """MicroWeldr - Convert SVG files to Prusa Core One G-code for plastic welding."""
 
-from importlib.metadata import version
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__version__ = version("microweldr")
-
-from microweldr.core.config import Config
-from microweldr.generators.models import WeldPath, WeldPoint
+if TYPE_CHECKING:
+    from microweldr.core.config import Config
+    from microweldr.generators.models import WeldPath, WeldPoint
 
 __all__ = [
     "Config",
     "WeldPath",
     "WeldPoint",
 ]
+
+# Module providing each public name; imported on first access so that CLI
+# subcommands which never touch them skip loading the generator stack
+_LAZY_EXPORTS = {
+    "Config": "microweldr.core.config",
+    "WeldPath": "microweldr.generators.models",
+    "WeldPoint": "microweldr.generators.models",
+}
+
+
+def __getattr__(name: str):
+    """Resolve the package version and public classes on first access (PEP 562)."""
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("microweldr")
+    elif name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__, "__version__"])
@@ -1,11 +1,13 @@
 """Configuration setup utilities for MicroWeldr."""
 
-import shutil
+import datetime
+import re
 from pathlib import Path
 
 import click
 
-from ..core.secrets_config import SecretsConfig
+# Keys whose values are never echoed (matched anywhere in the key name)
+_SENSITIVE_KEY_RE = re.compile(r"password|api[_-]?key|secret|token", re.IGNORECASE)
 
 
 @click.group()
@@ -55,7 +57,8 @@ def init(scope: str, force: bool):
         return
 
     try:
-        shutil.copy2(template_path, config_path)
+        # Only the template text is needed, not its timestamps or mode bits
+        config_path.write_bytes(template_path.read_bytes())
         click.echo(f"Created configuration file: {config_path}")
         click.echo("\nNext steps:")
         click.echo("1. Edit the file to add your printer's IP address and credentials")
@@ -73,27 +76,29 @@ def init(scope: str, force: bool):
 @config.command()
 def show():
     """Show current configuration and sources."""
+    from ..core.secrets_config import SecretsConfig
+
     try:
         secrets_config = SecretsConfig()
         config_data = secrets_config.to_dict()
         sources = secrets_config.list_sources()
 
-        click.echo("Configuration Sources (in load order):")
+        # Assemble the report and write it once rather than echoing per line
+        lines = ["Configuration Sources (in load order):"]
         if sources:
-            for i, source in enumerate(sources, 1):
-                click.echo(f"  {i}. {source}")
+            lines.extend(f"  {i}. {source}" for i, source in enumerate(sources, 1))
         else:
-            click.echo("  No configuration files found")
+            lines.append("  No configuration files found")
 
-        click.echo("\nMerged Configuration:")
+        lines.append("\nMerged Configuration:")
         if config_data:
             # Hide sensitive information
             safe_config = _sanitize_config(config_data)
-            import json
-
-            click.echo(json.dumps(safe_config, indent=2))
+            lines.append(_format_json(safe_config))
         else:
-            click.echo("  No configuration loaded")
+            lines.append("  No configuration loaded")
+
+        click.echo("\n".join(lines))
 
     except Exception as e:
         click.echo(f"Error loading configuration: {e}", err=True)
@@ -102,6 +107,8 @@ def show():
 @config.command()
 def validate():
     """Validate configuration and test printer connection."""
+    from ..core.secrets_config import SecretsConfig
+
     try:
         secrets_config = SecretsConfig()
         prusalink_config = secrets_config.get_prusalink_config()
@@ -151,6 +158,8 @@ def validate():
 @click.argument("value", required=False)
 def get(key: str, value: str | None):
     """Get or set a configuration value."""
+    from ..core.secrets_config import SecretsConfig
+
     try:
         secrets_config = SecretsConfig()
 
@@ -159,10 +168,7 @@ def get(key: str, value: str | None):
             result = secrets_config.get(key)
             if result is not None:
                 # Sanitize sensitive values
-                if any(
-                    sensitive in key.lower()
-                    for sensitive in ["password", "api_key", "secret"]
-                ):
+                if _SENSITIVE_KEY_RE.search(key):
                     click.echo(f"{key}: [HIDDEN]")
                 else:
                     click.echo(f"{key}: {result}")
@@ -176,25 +182,65 @@ def get(key: str, value: str | None):
         click.echo(f"Error: {e}", err=True)
 
 
-def _sanitize_config(config_data: dict) -> dict:
-    """Remove sensitive information from configuration for display."""
-    import copy
+def _format_json(data: dict) -> str:
+    """Pretty-print configuration data as JSON with two-space indentation.
 
-    safe_config = copy.deepcopy(config_data)
+    Uses orjson when it is installed (the ``fast-json`` extra). Both encoders
+    write non-ASCII text unescaped and dates/times in ISO 8601, so the output
+    is the same either way, except that floats needing an exponent may be
+    spelled differently (``1e-05`` vs ``0.00001``).
+    """
+    # Imported here rather than at module level so CLI start-up stays fast
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(data, indent=2, ensure_ascii=False, default=_iso_format)
+
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
 
-    # List of sensitive keys to hide
-    sensitive_keys = ["password", "api_key", "secret", "token"]
 
-    def sanitize_dict(d):
-        if isinstance(d, dict):
-            for key, value in d.items():
-                if any(sensitive in key.lower() for sensitive in sensitive_keys):
-                    d[key] = "[HIDDEN]"
-                elif isinstance(value, dict):
-                    sanitize_dict(value)
+def _iso_format(value):
+    """Encode TOML date and time values the way orjson does."""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
-    sanitize_dict(safe_config)
-    return safe_config
+
+def _sanitize_config(config_data: dict) -> dict:
+    """Remove sensitive information from configuration for display.
+
+    Sections without sensitive keys are shared with ``config_data`` rather
+    than copied; only dicts on the way to a hidden value are rebuilt.
+    Nested sections are walked with an explicit stack, so arbitrarily deep
+    configs cannot hit the recursion limit.
+    """
+    # Find the key path of every sensitive value
+    hidden_paths = []
+    stack = [((), config_data)]
+    while stack:
+        path, section = stack.pop()
+        for key, value in section.items():
+            if _SENSITIVE_KEY_RE.search(key):
+                hidden_paths.append((*path, key))
+            elif isinstance(value, dict):
+                stack.append(((*path, key), value))
+
+    if not hidden_paths:
+        return config_data
+
+    # Copy each section on the way to a hidden value once, keyed by its path
+    copies = {(): dict(config_data)}
+    for path in hidden_paths:
+        for depth in range(1, len(path)):
+            prefix = path[:depth]
+            if prefix not in copies:
+                parent = copies[prefix[:-1]]
+                parent[prefix[-1]] = copies[prefix] = dict(parent[prefix[-1]])
+        copies[path[:-1]][path[-1]] = "[HIDDEN]"
+
+    return copies[()]
 
 
 if __name__ == "__main__":
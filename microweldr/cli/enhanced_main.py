@@ -1,68 +1,82 @@
 """Enhanced CLI interface with click and improved UX."""
 
+import contextlib
+import json
 import logging
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
 
-from ..core.caching import OptimizedSVGParser
 from ..core.config import Config
-from ..core.graceful_degradation import ResilientPrusaLinkClient, check_system_health
-from ..core.logging_config import LogContext, setup_logging
-from ..core.progress import progress_context
-from ..core.resource_management import safe_gcode_generation
-from ..core.safety import SafetyError, validate_weld_operation
-from ..parsers.svg_parser import SVGParser
-from ..validation.validators import GCodeValidator, SVGValidator
 from .config_setup import config
 
+logger = logging.getLogger(__name__)
 
-# Custom click decorators for common options
-def common_options(func):
-    """Common CLI options decorator."""
-    func = click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")(
-        func
-    )
-    func = click.option(
-        "--quiet", "-q", is_flag=True, help="Suppress non-error output"
-    )(func)
-    func = click.option(
-        "--config",
-        "-c",
+# Parsers, validators and the printer client are imported inside the
+# commands that use them so --help and shell completion start quickly
+
+
+# Shared options, built once and attached to every command that uses them.
+# Listed in decorator application order; click reverses them for --help.
+_COMMON_PARAMS = (
+    click.Option(["--verbose", "-v"], is_flag=True, help="Enable verbose output"),
+    click.Option(["--quiet", "-q"], is_flag=True, help="Suppress non-error output"),
+    click.Option(
+        ["--config", "-c"],
         default="config.toml",
         help="Configuration file path",
         type=click.Path(exists=True),
-    )(func)
-    func = click.option("--log-file", help="Log file path")(func)
-    return func
-
+    ),
+    click.Option(["--log-file"], help="Log file path"),
+)
 
-def printer_options(func):
-    """Printer-related CLI options decorator."""
-    func = click.option(
-        "--secrets",
+_PRINTER_PARAMS = (
+    click.Option(
+        ["--secrets"],
         default="microweldr_secrets.toml",
         help="Secrets configuration file",
         type=click.Path(),
-    )(func)
-    func = click.option(
-        "--submit-to-printer",
+    ),
+    click.Option(
+        ["--submit-to-printer"],
         is_flag=True,
         help="Submit G-code to printer after generation",
-    )(func)
-    func = click.option(
-        "--auto-start", is_flag=True, help="Automatically start print after upload"
-    )(func)
-    func = click.option(
-        "--storage",
+    ),
+    click.Option(
+        ["--auto-start"], is_flag=True, help="Automatically start print after upload"
+    ),
+    click.Option(
+        ["--storage"],
         type=click.Choice(["local", "usb"]),
         default="local",
         help="Printer storage location",
-    )(func)
+    ),
+)
+
+
+def _attach_params(func, params):
+    """Attach pre-built click parameters to a command callback."""
+    if not hasattr(func, "__click_params__"):
+        func.__click_params__ = []
+    func.__click_params__.extend(params)
     return func
 
 
+# Custom click decorators for common options
+def common_options(func):
+    """Common CLI options decorator."""
+    return _attach_params(func, _COMMON_PARAMS)
+
+
+def printer_options(func):
+    """Printer-related CLI options decorator."""
+    return _attach_params(func, _PRINTER_PARAMS)
+
+
 @click.group()
 @click.version_option(prog_name="MicroWeldr")
 @click.pass_context
@@ -87,9 +101,15 @@ def cli(ctx):
     "--validate-only", is_flag=True, help="Only validate input, don't generate"
 )
 @click.option("--force", is_flag=True, help="Force generation despite warnings")
+@click.option("--yes", "-y", is_flag=True, help="Answer yes to confirmation prompts")
 @click.option(
     "--cache/--no-cache", default=True, help="Enable/disable SVG parsing cache"
 )
+@click.option(
+    "--skip-gcode-validation",
+    is_flag=True,
+    help="Don't re-read and check the generated G-code",
+)
 @common_options
 @printer_options
 @click.pass_context
@@ -102,7 +122,9 @@ def weld(
     dry_run,
     validate_only,
     force,
+    yes,
     cache,
+    skip_gcode_validation,
     verbose,
     quiet,
     config,
@@ -129,29 +151,44 @@ def weld(
         # Submit directly to printer
         microweldr weld design.svg --submit-to-printer --auto-start
 
+        # Scripted run without prompts
+        microweldr weld design.svg --submit-to-printer --yes
+
         # Validate only (no generation)
         microweldr weld design.svg --validate-only
     """
+    from ..core.caching import OptimizedSVGParser
+    from ..core.logging_config import LogContext, setup_logging
+    from ..core.progress import progress_context
+    from ..core.resource_management import safe_gcode_generation
+    from ..core.safety import SafetyError, validate_weld_operation
+    from ..outputs.streaming_gcode_subscriber import (
+        FilenameError,
+        validate_gcode_filename,
+    )
+    from ..parsers.svg_parser import SVGParser
+    from ..validation.validators import GCodeValidator
+
+    # Check secrets file exists if printer submission is requested; this
+    # needs neither logging nor the configuration, so fail before loading them
+    if submit_to_printer and not Path(secrets).exists():
+        click.echo(f"❌ Secrets file not found: {secrets}")
+        click.echo("Please create a secrets file with your printer configuration.")
+        raise click.Abort()
+
     # Setup logging
     log_level = "DEBUG" if verbose else "WARNING" if quiet else "INFO"
     setup_logging(level=log_level, log_file=log_file, console=not quiet)
 
-    logger = logging.getLogger(__name__)
-
     with LogContext("weld_generation"):
         try:
-            # Load configuration
-            with click.progressbar(length=1, label="Loading configuration") as bar:
-                config_obj = Config(config)
-                bar.update(1)
+            # Reject an output name the printer cannot use before parsing
+            output, animation = _resolve_outputs(svg_file, output, animation)
+            if not validate_only:
+                validate_gcode_filename(output)
 
-            # Check secrets file exists if printer submission is requested
-            if submit_to_printer and not Path(secrets).exists():
-                click.echo(f"❌ Secrets file not found: {secrets}")
-                click.echo(
-                    "Please create a secrets file with your printer configuration."
-                )
-                raise click.Abort()
+            # Load configuration
+            config_obj = Config(config)
 
             # Parse SVG with progress and caching
             click.echo(f"📄 Processing SVG: {svg_file}")
@@ -181,8 +218,7 @@ def weld(
 
             if errors:
                 click.echo("❌ Safety validation failed:")
-                for error in errors:
-                    click.echo(f"   • {error}")
+                click.echo(_bullet_lines(_group_repeats(errors)))
                 if not force:
                     raise click.Abort()
                 else:
@@ -190,25 +226,16 @@ def weld(
 
             if warnings:
                 click.echo("⚠️  Safety warnings:")
-                for warning in warnings:
-                    click.echo(f"   • {warning}")
-                if not force and not click.confirm("Continue despite warnings?"):
+                click.echo(_bullet_lines(_group_repeats(warnings)))
+                if not (force or yes) and not click.confirm(
+                    "Continue despite warnings?"
+                ):
                     raise click.Abort()
 
             if validate_only:
                 click.echo("✅ Validation completed successfully")
                 return
 
-            # Generate output file paths
-            output = svg_file.with_suffix(".gcode") if not output else Path(output)
-
-            if animation and not Path(animation).suffix:
-                animation = Path(animation).with_suffix(".svg")
-            elif not animation:
-                animation = svg_file.with_suffix("_animation.svg")
-            else:
-                animation = Path(animation)
-
             # Generate G-code with progress
             click.echo(f"⚙️  Generating G-code: {output}")
 
@@ -223,14 +250,15 @@ def weld(
                     )
                     progress.update(len(weld_paths))
 
-            # Validate generated G-code
-            validator = GCodeValidator()
-            result = validator.validate(str(output))
+            # Validate generated G-code; this reads the whole file back, so it
+            # can be skipped explicitly
+            if not skip_gcode_validation:
+                result = GCodeValidator.validate(str(output))
 
-            if not result.is_valid:
-                click.echo("⚠️  G-code validation warnings:")
-                for warning in result.warnings:
-                    click.echo(f"   • {warning}")
+                if not result.is_valid:
+                    click.echo("⚠️  G-code validation warnings:")
+                    if result.warnings:
+                        click.echo(_bullet_lines(result.warnings))
 
             # Generate animation
             if animation:
@@ -250,12 +278,12 @@ def weld(
             click.echo(f"✅ G-code generated: {output} ({gcode_size:,} bytes)")
 
             # Estimate print time
-            estimated_time = _estimate_print_time(weld_paths, config_obj.config)
+            estimated_time = _estimate_print_time(total_points, config_obj.config)
             click.echo(f"⏱️  Estimated print time: {estimated_time}")
 
             # Submit to printer if requested
             if submit_to_printer and not dry_run:
-                _submit_to_printer(output, secrets, auto_start, storage)
+                _submit_to_printer(output, secrets, auto_start, storage, yes)
             elif dry_run:
                 click.echo(
                     "🔍 Dry run completed - files generated but not sent to printer"
@@ -264,91 +292,170 @@ def weld(
             click.echo("🎉 Welding preparation completed successfully!")
 
         except SafetyError as e:
-            logger.error(f"Safety validation failed: {e}")
+            logger.error("Safety validation failed: %s", e)
             click.echo(f"❌ Safety error: {e}")
             raise click.Abort()
+        except FilenameError as e:
+            logger.error("Filename validation failed: %s", e)
+            click.echo(f"❌ Filename error: {e}")
+            click.echo(
+                "💡 Tip: Use a shorter filename (max 31 characters including .gcode extension)"
+            )
+            raise click.Abort()
         except Exception as e:
-            # Check if it's a filename error for better user messaging
-            if "filename" in str(e).lower() and "character" in str(e).lower():
-                logger.error(f"Filename validation failed: {e}")
-                click.echo(f"❌ Filename error: {e}")
-                click.echo(
-                    "💡 Tip: Use a shorter filename (max 31 characters including .gcode extension)"
-                )
-            else:
-                logger.error(f"Weld generation failed: {e}", exc_info=True)
-                click.echo(f"❌ Error: {e}")
+            # The traceback is only rendered when running with --verbose
+            logger.error(
+                "Weld generation failed: %s",
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            click.echo(f"❌ Error: {e}")
             raise click.Abort()
 
 
 @cli.command()
 @click.argument("svg_file", type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Print one machine-readable JSON result instead of text",
+)
+@click.option(
+    "--fail-fast", is_flag=True, help="Stop checking paths at the first error"
+)
 @common_options
 @click.pass_context
-def validate(ctx, svg_file, verbose, quiet, config, log_file):
+def validate(ctx, svg_file, as_json, fail_fast, verbose, quiet, config, log_file):
     """Validate SVG file for welding compatibility.
 
     Performs comprehensive validation of the SVG file including:
     - SVG structure and syntax
     - Weld parameter safety
     - Configuration compatibility
+
+    The parsed paths are stored in the ./.cache parse cache, so a following
+    weld run on the same file skips parsing.
     """
+    from ..core.caching import OptimizedSVGParser
+    from ..core.logging_config import setup_logging
+    from ..core.safety import validate_weld_operation
+    from ..validation.validators import SVGValidator
+
     # Setup logging
     log_level = "DEBUG" if verbose else "WARNING" if quiet else "INFO"
     setup_logging(level=log_level, log_file=log_file, console=not quiet)
 
-    click.echo(f"🔍 Validating SVG file: {svg_file}")
+    # In JSON mode the human-readable lines are skipped entirely and a single
+    # compact record is written to stdout when the command finishes
+    echo = _discard_echo if as_json else click.echo
+    result = {
+        "file": str(svg_file),
+        "valid": False,
+        "paths": 0,
+        "points": 0,
+        "errors": [],
+        "warnings": [],
+    }
+
+    # Configuration loading prints status banners to stdout; in JSON mode
+    # those go to stderr so stdout carries nothing but the record
+    stdout = sys.stdout
+    with (
+        contextlib.redirect_stdout(sys.stderr) if as_json else contextlib.nullcontext()
+    ):
+        echo(f"🔍 Validating SVG file: {svg_file}")
 
-    try:
-        # Validate SVG structure
-        svg_validator = SVGValidator()
-        svg_result = svg_validator.validate(str(svg_file))
+        try:
+            # Validate SVG structure
+            svg_result = SVGValidator.validate(str(svg_file))
 
-        if svg_result.is_valid:
-            click.echo("✅ SVG structure validation passed")
-        else:
-            click.echo("❌ SVG structure validation failed")
-            click.echo(f"   Error: {svg_result.message}")
-            return
+            if svg_result.is_valid:
+                echo("✅ SVG structure validation passed")
+            else:
+                echo("❌ SVG structure validation failed")
+                echo(f"   Error: {svg_result.message}")
+                result["errors"].append(svg_result.message)
+                return
 
-        # Load configuration and parse
-        config_obj = Config(config)
-        parser = SVGParser()
-        weld_paths = parser.parse_file(svg_file)
+            # Load configuration and parse through the same on-disk cache as
+            # weld, so a following weld run reuses this parse
+            config_obj = Config(config)
+            parser = OptimizedSVGParser(cache_enabled=True)
+            weld_paths = parser.parse_svg_file(svg_file)
 
-        if not weld_paths:
-            click.echo("❌ No weld paths found in SVG")
-            return
+            if not weld_paths:
+                echo("❌ No weld paths found in SVG")
+                result["errors"].append("No weld paths found in SVG")
+                return
 
-        # Safety validation
-        warnings, errors = validate_weld_operation(weld_paths, config_obj.config)
+            # Safety validation
+            warnings, errors = validate_weld_operation(
+                weld_paths, config_obj.config, fail_fast=fail_fast
+            )
+            total_points = sum(len(path.points) for path in weld_paths)
+            result.update(
+                valid=not errors,
+                paths=len(weld_paths),
+                points=total_points,
+                errors=errors,
+                warnings=warnings,
+            )
 
-        if errors:
-            click.echo("❌ Safety validation failed:")
-            for error in errors:
-                click.echo(f"   • {error}")
-        else:
-            click.echo("✅ Safety validation passed")
-
-        if warnings:
-            click.echo("⚠️  Validation warnings:")
-            for warning in warnings:
-                click.echo(f"   • {warning}")
-
-        # Summary
-        total_points = sum(len(path.points) for path in weld_paths)
-        click.echo("\n📊 Summary:")
-        click.echo(f"   • Paths: {len(weld_paths)}")
-        click.echo(f"   • Points: {total_points}")
-        click.echo(f"   • Errors: {len(errors)}")
-        click.echo(f"   • Warnings: {len(warnings)}")
-
-        if errors:
+            if errors:
+                echo("❌ Safety validation failed:")
+                echo(_bullet_lines(_group_repeats(errors)))
+            else:
+                echo("✅ Safety validation passed")
+
+            if warnings:
+                echo("⚠️  Validation warnings:")
+                echo(_bullet_lines(_group_repeats(warnings)))
+
+            # Summary
+            echo("\n📊 Summary:")
+            echo(f"   • Paths: {len(weld_paths)}")
+            echo(f"   • Points: {total_points}")
+            echo(f"   • Errors: {len(errors)}")
+            echo(f"   • Warnings: {len(warnings)}")
+
+            if errors:
+                raise click.Abort()
+
+        except Exception as e:
+            echo(f"❌ Validation failed: {e}")
+            if not isinstance(e, click.Abort):
+                result["valid"] = False
+                result["errors"].append(str(e))
             raise click.Abort()
 
-    except Exception as e:
-        click.echo(f"❌ Validation failed: {e}")
-        raise click.Abort()
+        finally:
+            if as_json:
+                click.echo(json.dumps(result, separators=(",", ":")), file=stdout)
+
+
+def _discard_echo(*args, **kwargs) -> None:
+    """Stand-in for click.echo that drops human-readable output."""
+
+
+def _group_repeats(messages: list[str]) -> list[str]:
+    """Collapse repeated messages into one line each, most frequent first.
+
+    Args:
+        messages: Messages in the order they were reported
+
+    Returns:
+        Unique messages, suffixed with a repeat count where it is above one
+    """
+    return [
+        message if count == 1 else f"{message} (x{count})"
+        for message, count in Counter(messages).most_common()
+    ]
+
+
+def _bullet_lines(messages: list[str]) -> str:
+    """Join messages into one indented bullet list, ready for a single echo."""
+    return "\n".join(f"   • {message}" for message in messages)
 
 
 @cli.command()
@@ -363,14 +470,26 @@ def status(ctx, secrets, verbose, quiet, config, log_file):
     - System health checks
     - Configuration validation
     """
+    from ..core.graceful_degradation import (
+        ResilientPrusaLinkClient,
+        check_system_health,
+    )
+    from ..core.logging_config import setup_logging
+
     # Setup logging
     log_level = "DEBUG" if verbose else "WARNING" if quiet else "INFO"
     setup_logging(level=log_level, log_file=log_file, console=not quiet)
 
     click.echo("🔍 Checking system status...")
 
-    # System health check
-    health = check_system_health()
+    # Query the printer in the background while the local health checks run
+    has_secrets = Path(secrets).exists()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if has_secrets:
+            printer_future = executor.submit(
+                lambda: ResilientPrusaLinkClient(secrets).get_status()
+            )
+        health = check_system_health()
 
     click.echo(f"\n🏥 System Health: {health['overall'].upper()}")
 
@@ -380,24 +499,22 @@ def status(ctx, secrets, verbose, quiet, config, log_file):
 
     if health["warnings"]:
         click.echo("\n⚠️  Warnings:")
-        for warning in health["warnings"]:
-            click.echo(f"   • {warning}")
+        click.echo(_bullet_lines(health["warnings"]))
 
     if health["errors"]:
         click.echo("\n❌ Errors:")
-        for error in health["errors"]:
-            click.echo(f"   • {error}")
+        click.echo(_bullet_lines(health["errors"]))
 
     # Printer status
-    if Path(secrets).exists():
+    if has_secrets:
         try:
-            client = ResilientPrusaLinkClient(secrets)
-            printer_status = client.get_status()
+            printer_status = printer_future.result()
 
             if printer_status.get("fallback"):
                 click.echo("\n🖨️  Printer: ❌ Connection failed (fallback mode)")
             else:
-                state = printer_status.get("printer", {}).get("state", "Unknown")
+                printer = printer_status.get("printer") or {}
+                state = printer.get("state", "Unknown")
                 emoji = (
                     "🟢"
                     if state == "Operational"
@@ -412,8 +529,8 @@ def status(ctx, secrets, verbose, quiet, config, log_file):
                 click.echo(f"\n🖨️  Printer: {emoji} {state}")
 
                 # Temperature info
-                bed_temp = printer_status.get("printer", {}).get("temp_bed", {})
-                nozzle_temp = printer_status.get("printer", {}).get("temp_nozzle", {})
+                bed_temp = printer.get("temp_bed", {})
+                nozzle_temp = printer.get("temp_nozzle", {})
 
                 if bed_temp:
                     click.echo(
@@ -445,6 +562,8 @@ def init_secrets(ctx, output, force, verbose, quiet, config, log_file):
     - Secure file permissions
     - Comprehensive security guidance
     """
+    from ..core.logging_config import setup_logging
+
     # Setup logging
     log_level = "DEBUG" if verbose else "WARNING" if quiet else "INFO"
     setup_logging(level=log_level, log_file=log_file, console=not quiet)
@@ -476,10 +595,23 @@ default_storage = "local"
         raise click.Abort()
 
 
-def _estimate_print_time(weld_paths, config):
-    """Estimate total print time."""
-    total_points = sum(len(path.points) for path in weld_paths)
+def _resolve_outputs(svg_file, output, animation):
+    """Resolve G-code and animation paths, defaulting to the input's folder."""
+    stem = svg_file.stem
+    output = Path(output) if output else svg_file.with_name(f"{stem}.gcode")
+
+    if animation:
+        if not os.path.splitext(animation)[1]:
+            animation = f"{animation}.svg"
+        animation = Path(animation)
+    else:
+        animation = svg_file.with_name(f"{stem}_animation.svg")
+
+    return output, animation
 
+
+def _estimate_print_time(total_points, config):
+    """Estimate total print time."""
     # Rough estimation based on weld times and movement
     avg_weld_time = config.get("normal_welds", {}).get("weld_time", 0.1)
     avg_move_time = 0.05  # Rough estimate for movement between points
@@ -494,8 +626,10 @@ def _estimate_print_time(weld_paths, config):
         return f"{total_time / 3600:.1f}h"
 
 
-def _submit_to_printer(gcode_path, secrets_path, auto_start, storage):
+def _submit_to_printer(gcode_path, secrets_path, auto_start, storage, yes=False):
     """Submit G-code to printer."""
+    from ..core.graceful_degradation import ResilientPrusaLinkClient
+
     click.echo("🚀 Submitting to printer...")
 
     try:
@@ -510,17 +644,20 @@ def _submit_to_printer(gcode_path, secrets_path, auto_start, storage):
         printer_state = status.get("printer", {}).get("state", "Unknown")
         if printer_state not in ["Operational", "Finished"]:
             click.echo(f"⚠️  Printer not ready (state: {printer_state})")
-            if not click.confirm("Continue anyway?"):
+            if not yes and not click.confirm("Continue anyway?"):
                 return
 
         # Upload file
         filename = gcode_path.name
 
-        with click.progressbar(length=1, label="Uploading to printer") as bar:
+        upload_size = gcode_path.stat().st_size
+        with click.progressbar(length=upload_size, label="Uploading to printer") as bar:
             result = client.upload_file(
-                str(gcode_path), filename, auto_start=auto_start
+                str(gcode_path),
+                filename,
+                auto_start=auto_start,
+                progress_callback=bar.update,
             )
-            bar.update(1)
 
         if result.get("fallback"):
             click.echo("⚠️  Upload failed - manual upload instructions provided")
@@ -595,6 +732,15 @@ def temp_off(
     **kwargs,
 ):
     """Turn off printer temperatures for safe handling."""
+    from ..core.constants import (
+        ConfigKeys,
+        ConfigSections,
+        DefaultValues,
+        GCodeCommands,
+    )
+    from ..prusalink.client import PrusaLinkClient
+    from ..prusalink.exceptions import PrusaLinkError
+
     try:
         # Load configuration
         config_path = kwargs.get("config", "config.toml")
@@ -602,8 +748,6 @@ def temp_off(
 
         # Get cooldown temperature from config or use provided value
         if cooldown_temp is None:
-            from ..core.constants import ConfigKeys, ConfigSections, DefaultValues
-
             cooldown_temp = main_config.get(
                 ConfigSections.TEMPERATURES,
                 ConfigKeys.COOLDOWN_TEMPERATURE,
@@ -648,10 +792,6 @@ def temp_off(
                 return
 
         # Connect to printer and execute cooldown
-        from ..core.constants import GCodeCommands
-        from ..prusalink.client import PrusaLinkClient
-        from ..prusalink.exceptions import PrusaLinkError
-
         try:
             client = PrusaLinkClient(str(secrets_config))
 
@@ -693,41 +833,27 @@ def temp_off(
             gcode_commands.append("")
             gcode_commands.append("; Temperature cooldown complete")
 
-            # Send G-code to printer
+            # Send G-code to printer straight from memory
             gcode_content = "\n".join(gcode_commands)
 
-            # Create temporary G-code file
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".gcode", delete=False
-            ) as f:
-                f.write(gcode_content)
-                temp_gcode_path = f.name
-
-            try:
-                # Upload and execute G-code
-                result = client.upload_gcode(
-                    temp_gcode_path, "microweldr_cooldown.gcode"
-                )
-                if result["success"]:
-                    click.echo("✅ Temperature cooldown commands sent successfully")
+            # Upload and execute G-code
+            result = client.upload_gcode(
+                gcode_content.encode(), remote_filename="microweldr_cooldown.gcode"
+            )
+            if result["success"]:
+                click.echo("✅ Temperature cooldown commands sent successfully")
 
-                    # Start the G-code
-                    if client.start_print("microweldr_cooldown.gcode"):
-                        click.echo("🚀 Cooldown sequence started")
-                        click.echo("✅ Temperature cooldown initiated successfully")
-                    else:
-                        click.echo("⚠️  G-code uploaded but failed to start", err=True)
+                # Start the G-code
+                if client.start_print("microweldr_cooldown.gcode"):
+                    click.echo("🚀 Cooldown sequence started")
+                    click.echo("✅ Temperature cooldown initiated successfully")
                 else:
-                    click.echo(
-                        f"❌ Failed to upload G-code: {result.get('error', 'Unknown error')}",
-                        err=True,
-                    )
-
-            finally:
-                # Clean up temporary file
-                Path(temp_gcode_path).unlink(missing_ok=True)
+                    click.echo("⚠️  G-code uploaded but failed to start", err=True)
+            else:
+                click.echo(
+                    f"❌ Failed to upload G-code: {result.get('error', 'Unknown error')}",
+                    err=True,
+                )
 
         except PrusaLinkError as e:
             click.echo(f"❌ Printer communication error: {e}", err=True)
@@ -784,14 +910,23 @@ def temp_on(
     ctx, secrets_config, bed_temp, nozzle_temp, chamber_temp, wait, force, **kwargs
 ):
     """Turn on printer temperatures for welding operations."""
+    from ..core.constants import (
+        ConfigKeys,
+        ConfigSections,
+        DefaultValues,
+        GCodeCommands,
+    )
+    from ..core.safety import SafetyValidator
+    from ..prusalink.client import PrusaLinkClient
+    from ..prusalink.exceptions import PrusaLinkError
+    from .temperature_control import wait_for_temperatures
+
     try:
         # Load configuration
         config_path = kwargs.get("config", "config.toml")
         main_config = Config(config_path)
 
         # Get temperatures from config if not provided
-        from ..core.constants import ConfigKeys, ConfigSections, DefaultValues
-
         if bed_temp is None:
             bed_temp = main_config.get(
                 ConfigSections.TEMPERATURES,
@@ -814,8 +949,6 @@ def temp_on(
             )
 
         # Validate temperatures
-        from ..core.safety import SafetyValidator
-
         validator = SafetyValidator()
 
         try:
@@ -839,10 +972,6 @@ def temp_on(
                 return
 
         # Connect to printer and execute heating
-        from ..core.constants import GCodeCommands
-        from ..prusalink.client import PrusaLinkClient
-        from ..prusalink.exceptions import PrusaLinkError
-
         try:
             client = PrusaLinkClient(str(secrets_config))
 
@@ -897,70 +1026,35 @@ def temp_on(
             gcode_commands.append("")
             gcode_commands.append("; Temperature heating complete")
 
-            # Send G-code to printer
+            # Send G-code to printer straight from memory
             gcode_content = "\n".join(gcode_commands)
 
-            # Create temporary G-code file
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".gcode", delete=False
-            ) as f:
-                f.write(gcode_content)
-                temp_gcode_path = f.name
-
-            try:
-                # Upload and execute G-code
-                result = client.upload_gcode(temp_gcode_path, "microweldr_heatup.gcode")
-                if result["success"]:
-                    click.echo("✅ Temperature heating commands sent successfully")
-
-                    # Start the G-code
-                    if client.start_print("microweldr_heatup.gcode"):
-                        click.echo("🚀 Heating sequence started")
-
-                        if wait:
-                            click.echo("⏱️  Waiting for temperatures to be reached...")
-                            # Monitor heating progress
-                            import time
-
-                            start_time = time.time()
-                            while time.time() - start_time < 300:  # 5 minute timeout
-                                time.sleep(5)
-                                current_status = client.get_status()
-                                click.echo(
-                                    f"   Bed: {current_status.bed_actual}°C/{bed_temp}°C, "
-                                    f"Nozzle: {current_status.nozzle_actual}°C/{nozzle_temp}°C"
-                                )
-
-                                # Check if temperatures reached
-                                bed_ready = (
-                                    abs(current_status.bed_actual - bed_temp) <= 2
-                                )
-                                nozzle_ready = (
-                                    abs(current_status.nozzle_actual - nozzle_temp) <= 2
-                                )
-
-                                if bed_ready and nozzle_ready:
-                                    click.echo("✅ Target temperatures reached!")
-                                    break
-                            else:
-                                click.echo(
-                                    "⚠️  Timeout waiting for temperatures", err=True
-                                )
-
-                        click.echo("✅ Temperature heating initiated successfully")
-                    else:
-                        click.echo("⚠️  G-code uploaded but failed to start", err=True)
-                else:
-                    click.echo(
-                        f"❌ Failed to upload G-code: {result.get('error', 'Unknown error')}",
-                        err=True,
-                    )
+            # Upload and execute G-code
+            result = client.upload_gcode(
+                gcode_content.encode(), remote_filename="microweldr_heatup.gcode"
+            )
+            if result["success"]:
+                click.echo("✅ Temperature heating commands sent successfully")
+
+                # Start the G-code
+                if client.start_print("microweldr_heatup.gcode"):
+                    click.echo("🚀 Heating sequence started")
+
+                    if wait:
+                        click.echo("⏱️  Waiting for temperatures to be reached...")
+                        if wait_for_temperatures(client, bed_temp, nozzle_temp):
+                            click.echo("✅ Target temperatures reached!")
+                        else:
+                            click.echo("⚠️  Timeout waiting for temperatures", err=True)
 
-            finally:
-                # Clean up temporary file
-                Path(temp_gcode_path).unlink(missing_ok=True)
+                    click.echo("✅ Temperature heating initiated successfully")
+                else:
+                    click.echo("⚠️  G-code uploaded but failed to start", err=True)
+            else:
+                click.echo(
+                    f"❌ Failed to upload G-code: {result.get('error', 'Unknown error')}",
+                    err=True,
+                )
 
         except PrusaLinkError as e:
             click.echo(f"❌ Printer communication error: {e}", err=True)
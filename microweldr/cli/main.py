@@ -889,12 +889,7 @@ def cmd_weld(args):
     print("=" * 50)
 
     try:
-        # Load configuration
-        config = Config(args.config)
-        if args.verbose:
-            print(f"✓ Configuration loaded from {args.config}")
-
-        # Validate input file
+        # Validate input file first so a bad path fails before any parsing
         input_path = Path(args.svg_file)
         if not input_path.exists():
             print(f"❌ Input file not found: {args.svg_file}")
@@ -903,6 +898,11 @@ def cmd_weld(args):
         if args.verbose:
             print(f"✓ Input file found: {args.svg_file}")
 
+        # Load configuration
+        config = Config(args.config)
+        if args.verbose:
+            print(f"✓ Configuration loaded from {args.config}")
+
         # Set up output paths
         if args.output:
             output_path = Path(args.output)
@@ -1027,12 +1027,7 @@ def cmd_full_weld(args):
     print("=" * 55)
 
     try:
-        # Load configuration
-        config = Config(args.config)
-        if args.verbose:
-            print(f"✓ Configuration loaded from {args.config}")
-
-        # Validate SVG file
+        # Validate SVG file first so bad input fails before config parsing
         svg_path = Path(args.svg_file)
         if not svg_path.exists():
             print(f"❌ SVG file not found: {args.svg_file}")
@@ -1042,12 +1037,16 @@ def cmd_full_weld(args):
             print(f"✓ SVG file found: {args.svg_file}")
 
         # Validate SVG content
-        svg_validator = SVGValidator()
-        svg_result = svg_validator.validate_file(svg_path)
+        svg_result = SVGValidator.validate_file(svg_path)
 
         if not svg_result.is_valid:
             raise SVGParseError(f"SVG validation failed: {svg_result.message}")
 
+        # Load configuration
+        config = Config(args.config)
+        if args.verbose:
+            print(f"✓ Configuration loaded from {args.config}")
+
         if svg_result.warnings:
             print("⚠️ SVG validation warnings:")
             for warning in svg_result.warnings:
@@ -1161,7 +1160,7 @@ def cmd_config(args) -> bool:
     import json
     import shutil
 
-    if not hasattr(args, "config_command") or args.config_command is None:
+    if getattr(args, "config_command", None) is None:
         print(
             "Config command requires a subcommand. Use 'microweldr config --help' for options."
         )
@@ -1320,10 +1319,7 @@ def main():
         # For subcommands that take svg_file, parse differently
         args = parser.parse_args()
         # The svg_file should be in the remaining arguments after the command
-        if (
-            args.command in ["frame", "weld", "full-weld"]
-            and not hasattr(args, "svg_file")
-        ) or args.svg_file is None:
+        if getattr(args, "svg_file", None) is None:
             # Try to get the svg_file from the command line manually
             cmd_index = sys.argv.index(args.command)
             if cmd_index + 1 < len(sys.argv):
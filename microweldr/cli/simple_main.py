@@ -12,8 +12,6 @@ from ..core.events import (
     PathEvent,
 )
 from ..core.logging_config import setup_logging
-from ..outputs.bambu_3mf_subscriber import Bambu3mfSubscriber
-from ..outputs.gif_animation_subscriber import GIFAnimationSubscriber
 
 
 def get_version() -> str:
@@ -163,7 +161,8 @@ def process_weld_file(
     file_path: str, config: Config, is_frangible: bool = False
 ) -> list[dict]:
     """Process a weld file and return points."""
-    if not Path(file_path).exists():
+    weld_file = Path(file_path)
+    if not weld_file.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
     print(
@@ -174,9 +173,7 @@ def process_weld_file(
     from ..generators.point_iterator_factory import iterate_points_from_file
 
     points = list(
-        iterate_points_from_file(
-            Path(file_path), config=config, enable_deduplication=True
-        )
+        iterate_points_from_file(weld_file, config=config, enable_deduplication=True)
     )
 
     # Override weld type if explicitly specified via -frange flag
@@ -184,7 +181,7 @@ def process_weld_file(
         for point in points:
             point["weld_type"] = "frangible"
 
-    print(f"✅ Loaded {len(points)} points from {Path(file_path).name}")
+    print(f"✅ Loaded {len(points)} points from {weld_file.name}")
     return points
 
 
@@ -200,11 +197,12 @@ def generate_gcode(points: list[dict], output_path: str, config: Config, args) -
         bed_size_x = config.get("printer", "bed_size_x", 250.0)
         bed_size_y = config.get("printer", "bed_size_y", 220.0)
 
-        # Get CLI flags for bed leveling and film insertion
+        # Read CLI flags once; callers may pass partial namespaces
         enable_bed_leveling = getattr(args, "level_bed", False)
         include_user_pause = getattr(
             args, "stop_for_film", True
         )  # Default True for safety
+        verbose = getattr(args, "verbose", False)
 
         # Create two-pass processor with proper flags
         processor = TwoPassProcessor(
@@ -275,7 +273,7 @@ def generate_gcode(points: list[dict], output_path: str, config: Config, args) -
         success = processor.process_with_centering(
             events=events,
             output_path=Path(output_path),
-            verbose=getattr(args, "verbose", False),
+            verbose=verbose,
         )
 
         if success:
@@ -295,13 +293,14 @@ def generate_gcode(points: list[dict], output_path: str, config: Config, args) -
 def generate_animation(points: list[dict], output_path: str, config: Config) -> bool:
     """Generate animated GIF showing weld sequence progression."""
     try:
+        from ..outputs.gif_animation_subscriber import GIFAnimationSubscriber
+
         output_path_obj = Path(output_path)
 
         # Ensure .gif extension
         if output_path_obj.suffix.lower() != ".gif":
             output_path_obj = output_path_obj.with_suffix(".gif")
             print(f"ℹ️  Changed animation output to: {output_path_obj}")
-            output_path = str(output_path_obj)  # Update the string path too
 
         print(f"🎨 Generating animated GIF: {output_path_obj}")
         subscriber = GIFAnimationSubscriber(output_path_obj, config)
@@ -362,13 +361,13 @@ def generate_animation(points: list[dict], output_path: str, config: Config) ->
         subscriber.handle_event(end_event)
 
         # Check if file was created
-        if Path(output_path).exists():
-            file_size = Path(output_path).stat().st_size
-            print(f"✅ PNG animation generated: {output_path} ({file_size:,} bytes)")
-            return True
-        else:
-            print(f"❌ Failed to generate PNG animation: {output_path}")
+        try:
+            file_size = output_path_obj.stat().st_size
+        except FileNotFoundError:
+            print(f"❌ Failed to generate PNG animation: {output_path_obj}")
             return False
+        print(f"✅ PNG animation generated: {output_path_obj} ({file_size:,} bytes)")
+        return True
 
     except Exception as e:
         print(f"❌ Animation generation failed: {e}")
@@ -380,13 +379,16 @@ def generate_bambu_3mf(
 ) -> bool:
     """Package generated G-code into a Bambu .gcode.3mf with weld pattern thumbnail."""
     try:
-        print(f"📦 Generating Bambu 3MF: {output_3mf_path}")
+        from ..outputs.bambu_3mf_subscriber import Bambu3mfSubscriber
+
+        output_3mf = Path(output_3mf_path)
+        print(f"📦 Generating Bambu 3MF: {output_3mf}")
 
         weld_spot_diameter = config.get("nozzle", "outer_diameter", 2.0)
 
         subscriber = Bambu3mfSubscriber(
             gcode_path=Path(gcode_path),
-            output_3mf_path=Path(output_3mf_path),
+            output_3mf_path=output_3mf,
             weld_spot_diameter=weld_spot_diameter,
         )
 
@@ -423,13 +425,13 @@ def generate_bambu_3mf(
             )
         )
 
-        if Path(output_3mf_path).exists():
-            file_size = Path(output_3mf_path).stat().st_size
-            print(f"✅ Bambu 3MF generated: {output_3mf_path} ({file_size:,} bytes)")
-            return True
-        else:
-            print(f"❌ Failed to generate Bambu 3MF: {output_3mf_path}")
+        try:
+            file_size = output_3mf.stat().st_size
+        except FileNotFoundError:
+            print(f"❌ Failed to generate Bambu 3MF: {output_3mf}")
             return False
+        print(f"✅ Bambu 3MF generated: {output_3mf} ({file_size:,} bytes)")
+        return True
 
     except Exception as e:
         print(f"❌ Bambu 3MF generation failed: {e}")
@@ -495,34 +497,35 @@ def main():
         if not validate_filename_length(gcode_output):
             return 1
 
-        # Generate G-code
-        if not generate_gcode(all_points, gcode_output, config, args):
-            return 1
-
-        # Generate Bambu .gcode.3mf if requested
+        # Resolve every output path before any generation starts
         bambu_output = None
         if getattr(args, "bambu", False):
-            gcode_path = Path(gcode_output)
-            bambu_output = str(gcode_path.with_suffix(".gcode.3mf"))
-            if not generate_bambu_3mf(all_points, gcode_output, bambu_output, config):
-                print(
-                    "⚠️  Bambu 3MF generation failed, but G-code was created successfully"
-                )
+            bambu_output = str(Path(gcode_output).with_suffix(".gcode.3mf"))
 
-        # Generate animation if requested
         animation_output = None
         if args.animation:
-            # Ensure .gif extension for display
+            # Animations are always written as GIF
             animation_path = Path(args.animation)
             if animation_path.suffix.lower() != ".gif":
-                animation_output = str(animation_path.with_suffix(".gif"))
-            else:
-                animation_output = args.animation
+                animation_path = animation_path.with_suffix(".gif")
+                print(f"ℹ️  Changed animation output to: {animation_path}")
+            animation_output = str(animation_path)
 
-            if not generate_animation(all_points, args.animation, config):
-                print(
-                    "⚠️  Animation generation failed, but G-code was created successfully"
-                )
+        # Generate G-code
+        if not generate_gcode(all_points, gcode_output, config, args):
+            return 1
+
+        # Generate Bambu .gcode.3mf if requested
+        if bambu_output and not generate_bambu_3mf(
+            all_points, gcode_output, bambu_output, config
+        ):
+            print("⚠️  Bambu 3MF generation failed, but G-code was created successfully")
+
+        # Generate animation if requested
+        if animation_output and not generate_animation(
+            all_points, animation_output, config
+        ):
+            print("⚠️  Animation generation failed, but G-code was created successfully")
 
         print("\n🎉 Welding preparation completed successfully!")
         print("📁 Output files:")
@@ -2,6 +2,7 @@
 
 import logging
 import sys
+import time
 from pathlib import Path
 
 import click
@@ -18,6 +19,66 @@ from ..prusalink.exceptions import PrusaLinkError
 
 logger = logging.getLogger(__name__)
 
+# Heat-up monitoring: give up after this long, and treat readings within the
+# tolerance (°C) of the target as reached
+HEATUP_TIMEOUT = 300.0
+HEATUP_TOLERANCE = 2.0
+
+# Minimum seconds between heat-up status lines, however fast the polling
+STATUS_ECHO_INTERVAL = 1.0
+
+
+def _heatup_poll_interval(error: float) -> float:
+    """Seconds to wait before the next status poll, shorter near the target."""
+    if error > 20:
+        return 5.0
+    if error > 5:
+        return 2.0
+    return 0.5
+
+
+def wait_for_temperatures(
+    client, bed_temp: float, nozzle_temp: float, timeout: float = HEATUP_TIMEOUT
+) -> bool:
+    """Poll the printer until bed and nozzle reach their targets.
+
+    The first reading is taken immediately; later polls come more often as
+    the temperatures approach their targets. Status lines are printed at
+    most once per STATUS_ECHO_INTERVAL, plus the final reading.
+
+    Args:
+        client: PrusaLinkClient used to read the printer status
+        bed_temp: Target bed temperature in °C
+        nozzle_temp: Target nozzle temperature in °C
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if both temperatures were reached before the timeout
+    """
+    deadline = time.monotonic() + timeout
+    last_echo = None
+    while True:
+        printer_info = client.get_printer_status().get("printer", {})
+        bed_actual = printer_info.get("temp_bed", 0.0)
+        nozzle_actual = printer_info.get("temp_nozzle", 0.0)
+        error = max(abs(bed_actual - bed_temp), abs(nozzle_actual - nozzle_temp))
+        now = time.monotonic()
+        remaining = deadline - now
+        done = error <= HEATUP_TOLERANCE or remaining <= 0
+
+        if done or last_echo is None or now - last_echo >= STATUS_ECHO_INTERVAL:
+            click.echo(
+                f"   Bed: {bed_actual}°C/{bed_temp}°C, "
+                f"Nozzle: {nozzle_actual}°C/{nozzle_temp}°C"
+            )
+            last_echo = now
+
+        if error <= HEATUP_TOLERANCE:
+            return True
+        if remaining <= 0:
+            return False
+        time.sleep(min(_heatup_poll_interval(error), remaining))
+
 
 @click.command()
 @click.option(
@@ -171,54 +232,38 @@ def temp_off(
             gcode_commands.append("")
             gcode_commands.append("; Temperature cooldown complete")
 
-            # Send G-code to printer
+            # Send G-code to printer straight from memory
             gcode_content = "\n".join(gcode_commands)
 
-            # Create temporary G-code file
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".gcode", delete=False
-            ) as f:
-                f.write(gcode_content)
-                temp_gcode_path = f.name
-
-            try:
-                # Upload and execute G-code
-                result = client.upload_gcode(
-                    temp_gcode_path, "microweldr_cooldown.gcode"
-                )
-                if result["success"]:
-                    click.echo("✅ Temperature cooldown commands sent successfully")
-
-                    # Start the G-code
-                    if client.start_print("microweldr_cooldown.gcode"):
-                        click.echo("🚀 Cooldown sequence started")
-
-                        # Monitor for a few seconds
-                        import time
-
-                        click.echo("⏱️  Monitoring cooldown...")
-                        for _i in range(5):
-                            time.sleep(1)
-                            current_status = client.get_status()
-                            click.echo(
-                                f"   Bed: {current_status.bed_actual}°C, Nozzle: {current_status.nozzle_actual}°C"
-                            )
-
-                        click.echo("✅ Temperature cooldown initiated successfully")
-                    else:
-                        click.echo("⚠️  G-code uploaded but failed to start", err=True)
+            # Upload and execute G-code
+            result = client.upload_gcode(
+                gcode_content.encode(), remote_filename="microweldr_cooldown.gcode"
+            )
+            if result["success"]:
+                click.echo("✅ Temperature cooldown commands sent successfully")
+
+                # Start the G-code
+                if client.start_print("microweldr_cooldown.gcode"):
+                    click.echo("🚀 Cooldown sequence started")
+
+                    # Monitor for a few seconds
+                    click.echo("⏱️  Monitoring cooldown...")
+                    for _i in range(5):
+                        time.sleep(1)
+                        current_status = client.get_status()
+                        click.echo(
+                            f"   Bed: {current_status.bed_actual}°C, Nozzle: {current_status.nozzle_actual}°C"
+                        )
+
+                    click.echo("✅ Temperature cooldown initiated successfully")
                 else:
-                    click.echo(
-                        f"❌ Failed to upload G-code: {result.get('error', 'Unknown error')}",
-                        err=True,
-                    )
-                    sys.exit(1)
-
-            finally:
-                # Clean up temporary file
-                Path(temp_gcode_path).unlink(missing_ok=True)
+                    click.echo("⚠️  G-code uploaded but failed to start", err=True)
+            else:
+                click.echo(
+                    f"❌ Failed to upload G-code: {result.get('error', 'Unknown error')}",
+                    err=True,
+                )
+                sys.exit(1)
 
         except PrusaLinkError as e:
             click.echo(f"❌ Printer communication error: {e}", err=True)
@@ -403,83 +448,46 @@ def temp_on(
             gcode_commands.append("")
             gcode_commands.append("; Temperature heating complete")
 
-            # Send G-code to printer
+            # Send G-code to printer straight from memory
             gcode_content = "\n".join(gcode_commands)
 
-            # Create temporary G-code file
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".gcode", delete=False
-            ) as f:
-                f.write(gcode_content)
-                temp_gcode_path = f.name
-
-            try:
-                # Upload and execute G-code
-                result = client.upload_gcode(temp_gcode_path, "microweldr_heatup.gcode")
-                if result["success"]:
-                    click.echo("✅ Temperature heating commands sent successfully")
-
-                    # Start the G-code
-                    if client.start_print("microweldr_heatup.gcode"):
-                        click.echo("🚀 Heating sequence started")
-
-                        if wait:
-                            click.echo("⏱️  Waiting for temperatures to be reached...")
-                            # Monitor heating progress
-                            import time
-
-                            start_time = time.time()
-                            while time.time() - start_time < 300:  # 5 minute timeout
-                                time.sleep(5)
-                                current_status = client.get_status()
-                                click.echo(
-                                    f"   Bed: {current_status.bed_actual}°C/{bed_temp}°C, "
-                                    f"Nozzle: {current_status.nozzle_actual}°C/{nozzle_temp}°C"
-                                )
-
-                                # Check if temperatures reached
-                                bed_ready = (
-                                    abs(current_status.bed_actual - bed_temp) <= 2
-                                )
-                                nozzle_ready = (
-                                    abs(current_status.nozzle_actual - nozzle_temp) <= 2
-                                )
-
-                                if bed_ready and nozzle_ready:
-                                    click.echo("✅ Target temperatures reached!")
-                                    break
-                            else:
-                                click.echo(
-                                    "⚠️  Timeout waiting for temperatures", err=True
-                                )
+            # Upload and execute G-code
+            result = client.upload_gcode(
+                gcode_content.encode(), remote_filename="microweldr_heatup.gcode"
+            )
+            if result["success"]:
+                click.echo("✅ Temperature heating commands sent successfully")
+
+                # Start the G-code
+                if client.start_print("microweldr_heatup.gcode"):
+                    click.echo("🚀 Heating sequence started")
+
+                    if wait:
+                        click.echo("⏱️  Waiting for temperatures to be reached...")
+                        if wait_for_temperatures(client, bed_temp, nozzle_temp):
+                            click.echo("✅ Target temperatures reached!")
                         else:
-                            # Just monitor for a few seconds
-                            import time
-
-                            click.echo("⏱️  Monitoring heating startup...")
-                            for _i in range(3):
-                                time.sleep(2)
-                                current_status = client.get_status()
-                                click.echo(
-                                    f"   Bed: {current_status.bed_actual}°C → {bed_temp}°C, "
-                                    f"Nozzle: {current_status.nozzle_actual}°C → {nozzle_temp}°C"
-                                )
-
-                        click.echo("✅ Temperature heating initiated successfully")
+                            click.echo("⚠️  Timeout waiting for temperatures", err=True)
                     else:
-                        click.echo("⚠️  G-code uploaded but failed to start", err=True)
-                else:
-                    click.echo(
-                        f"❌ Failed to upload G-code: {result.get('error', 'Unknown error')}",
-                        err=True,
-                    )
-                    sys.exit(1)
+                        # Just monitor for a few seconds
+                        click.echo("⏱️  Monitoring heating startup...")
+                        for _i in range(3):
+                            time.sleep(2)
+                            current_status = client.get_status()
+                            click.echo(
+                                f"   Bed: {current_status.bed_actual}°C → {bed_temp}°C, "
+                                f"Nozzle: {current_status.nozzle_actual}°C → {nozzle_temp}°C"
+                            )
 
-            finally:
-                # Clean up temporary file
-                Path(temp_gcode_path).unlink(missing_ok=True)
+                    click.echo("✅ Temperature heating initiated successfully")
+                else:
+                    click.echo("⚠️  G-code uploaded but failed to start", err=True)
+            else:
+                click.echo(
+                    f"❌ Failed to upload G-code: {result.get('error', 'Unknown error')}",
+                    err=True,
+                )
+                sys.exit(1)
 
         except PrusaLinkError as e:
             click.echo(f"❌ Printer communication error: {e}", err=True)
@@ -3,6 +3,7 @@
 import contextlib
 import hashlib
 import logging
+import os
 import pickle  # nosec B403 - Used for internal caching only, not user data
 import time
 from collections.abc import Callable
@@ -27,8 +28,9 @@ class FileCache:
             cache_dir: Directory for cache files (default: .cache)
             max_age_seconds: Maximum age of cache entries in seconds
         """
+        # The directory is created on the first write, so importing this
+        # module or only reading the cache leaves no empty directory behind
         self.cache_dir = Path(cache_dir or ".cache")
-        self.cache_dir.mkdir(exist_ok=True)
         self.max_age = max_age_seconds
 
     def _get_cache_key(self, content: str, operation: str = "default") -> str:
@@ -42,15 +44,15 @@ class FileCache:
 
     def _is_cache_valid(self, cache_path: Path) -> bool:
         """Check if cache file is still valid."""
-        if not cache_path.exists():
-            return False
-
         try:
-            age = time.time() - cache_path.stat().st_mtime
-            return age < self.max_age
+            return self._is_fresh(cache_path.stat())
         except OSError:
             return False
 
+    def _is_fresh(self, stat_result: os.stat_result) -> bool:
+        """Check whether a cache file's stat result is within the max age."""
+        return time.time() - stat_result.st_mtime < self.max_age
+
     def get(self, content: str, operation: str = "default") -> Any | None:
         """Get cached result for content and operation.
 
@@ -64,11 +66,17 @@ class FileCache:
         cache_key = self._get_cache_key(content, operation)
         cache_path = self._get_cache_path(cache_key)
 
-        if not self._is_cache_valid(cache_path):
+        # Open first and check freshness on the open handle, so a lookup costs
+        # one open + fstat instead of separate exists/stat/open calls
+        try:
+            f = open(cache_path, "rb")  # noqa: SIM115 - closed by the with below
+        except OSError:
             return None
 
         try:
-            with open(cache_path, "rb") as f:
+            with f:
+                if not self._is_fresh(os.fstat(f.fileno())):
+                    return None
                 result = pickle.load(f)  # nosec B301 - Internal cache files only
             logger.debug(f"Cache hit for {operation}: {cache_key}")
             return result
@@ -91,6 +99,7 @@ class FileCache:
         cache_path = self._get_cache_path(cache_key)
 
         try:
+            self.cache_dir.mkdir(exist_ok=True)
             with open(cache_path, "wb") as f:
                 pickle.dump(result, f)
             logger.debug(f"Cached result for {operation}: {cache_key}")
@@ -167,9 +176,9 @@ def cached_operation(operation: str = "default", max_age: int = 3600):
                 return cached_result
 
             # Execute function and cache result
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
 
             # Only cache if execution took significant time
             if execution_time > 0.1:  # 100ms threshold
@@ -186,14 +195,22 @@ def cached_operation(operation: str = "default", max_age: int = 3600):
 class OptimizedSVGParser:
     """Optimized SVG parser with caching and performance improvements."""
 
-    def __init__(self, cache_enabled: bool = True):
+    def __init__(self, cache_enabled: bool = True, dot_spacing: float = 2.0):
         """Initialize optimized parser.
 
         Args:
             cache_enabled: Whether to enable caching
+            dot_spacing: Spacing between weld dots passed to the SVG parser
         """
         self.cache_enabled = cache_enabled
+        self.dot_spacing = dot_spacing
         self.cache = FileCache(max_age_seconds=1800)  # 30 minutes
+        # Parse results depend on the SVG content and the dot spacing, so the
+        # spacing is part of the cache operation name
+        self._cache_operation = f"svg_parse_{dot_spacing:g}"
+        # Entries keyed by (path, mtime_ns, size) let an unchanged file be
+        # served without reading and hashing its content
+        self._stat_cache_operation = f"{self._cache_operation}_stat"
         self._parse_stats = {
             "cache_hits": 0,
             "cache_misses": 0,
@@ -221,6 +238,16 @@ class OptimizedSVGParser:
         """
         svg_path = Path(svg_path)
 
+        stat_key = None
+        if self.cache_enabled:
+            stat_key = self._stat_key(svg_path)
+            if stat_key is not None:
+                cached_result = self.cache.get(stat_key, self._stat_cache_operation)
+                if cached_result is not None:
+                    self._parse_stats["cache_hits"] += 1
+                    logger.info(f"SVG parse cache hit for {svg_path.name}")
+                    return cached_result
+
         # Read file content
         try:
             content = svg_path.read_text(encoding="utf-8")
@@ -230,24 +257,28 @@ class OptimizedSVGParser:
 
         # Check cache if enabled
         if self.cache_enabled:
-            cached_result = self.cache.get(content, "svg_parse")
+            cached_result = self.cache.get(content, self._cache_operation)
             if cached_result is not None:
                 self._parse_stats["cache_hits"] += 1
                 logger.info(f"SVG parse cache hit for {svg_path.name}")
+                if stat_key is not None:
+                    self.cache.set(stat_key, cached_result, self._stat_cache_operation)
                 return cached_result
 
         # Parse SVG (cache miss)
-        start_time = time.time()
+        start_time = time.perf_counter()
         self._parse_stats["cache_misses"] += 1
 
         try:
             # Import the actual parser here to avoid circular imports
-            from ..core.svg_parser import SVGParser
+            from ..parsers.svg_parser import SVGParser
 
-            parser = SVGParser()
-            weld_paths = parser.parse_file(svg_path)
+            # Parse the content already read for the cache key rather than
+            # opening and reading the file a second time
+            parser = SVGParser(dot_spacing=self.dot_spacing)
+            weld_paths = parser.parse_string(content)
 
-            parse_time = time.time() - start_time
+            parse_time = time.perf_counter() - start_time
             self._parse_stats["total_parse_time"] += parse_time
 
             logger.info(
@@ -258,7 +289,9 @@ class OptimizedSVGParser:
             if (
                 self.cache_enabled and parse_time > 0.001
             ):  # 1ms threshold (lowered for tests)
-                self.cache.set(content, weld_paths, "svg_parse")
+                self.cache.set(content, weld_paths, self._cache_operation)
+                if stat_key is not None:
+                    self.cache.set(stat_key, weld_paths, self._stat_cache_operation)
                 logger.debug(f"Cached SVG parse result for {svg_path.name}")
 
             return weld_paths
@@ -267,6 +300,22 @@ class OptimizedSVGParser:
             logger.error(f"SVG parsing failed for {svg_path}: {e}")
             raise
 
+    @staticmethod
+    def _stat_key(svg_path: Path) -> str | None:
+        """Build a cache key from the file's identity and modification state.
+
+        Args:
+            svg_path: Path to SVG file
+
+        Returns:
+            Key string, or None if the file cannot be stat'ed
+        """
+        try:
+            stat_result = svg_path.stat()
+        except OSError:
+            return None
+        return f"{svg_path.resolve()}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
+
     def get_stats(self) -> dict[str, Any]:
         """Get parsing statistics.
 
@@ -309,6 +358,9 @@ class PerformanceMonitor:
         """Initialize performance monitor."""
         self.metrics: dict[str, list[float]] = {}
         self._start_times: dict[str, float] = {}
+        # Running [count, total, min, max] per operation, kept up to date in
+        # end_operation so statistics never need to rescan the durations
+        self._aggregates: dict[str, list[float]] = {}
 
     def start_operation(self, operation: str) -> None:
         """Start timing an operation.
@@ -316,7 +368,7 @@ class PerformanceMonitor:
         Args:
             operation: Operation identifier
         """
-        self._start_times[operation] = time.time()
+        self._start_times[operation] = time.perf_counter()
 
     def end_operation(self, operation: str) -> float:
         """End timing an operation and record the duration.
@@ -331,13 +383,19 @@ class PerformanceMonitor:
             logger.warning(f"No start time recorded for operation: {operation}")
             return 0.0
 
-        duration = time.time() - self._start_times[operation]
+        duration = time.perf_counter() - self._start_times[operation]
         del self._start_times[operation]
 
-        if operation not in self.metrics:
-            self.metrics[operation] = []
+        self.metrics.setdefault(operation, []).append(duration)
 
-        self.metrics[operation].append(duration)
+        aggregate = self._aggregates.get(operation)
+        if aggregate is None:
+            self._aggregates[operation] = [1, duration, duration, duration]
+        else:
+            aggregate[0] += 1
+            aggregate[1] += duration
+            aggregate[2] = min(aggregate[2], duration)
+            aggregate[3] = max(aggregate[3], duration)
 
         # Log slow operations
         if duration > 1.0:  # 1 second threshold
@@ -355,31 +413,24 @@ class PerformanceMonitor:
             Performance statistics
         """
         if operation:
-            if operation not in self.metrics:
+            if operation not in self._aggregates:
                 return {}
 
-            durations = self.metrics[operation]
-            return {
-                "operation": operation,
-                "count": len(durations),
-                "total_time": sum(durations),
-                "average_time": sum(durations) / len(durations),
-                "min_time": min(durations),
-                "max_time": max(durations),
-            }
+            return {"operation": operation, **self._summarize(operation)}
 
         # Return stats for all operations
-        stats = {}
-        for op, durations in self.metrics.items():
-            stats[op] = {
-                "count": len(durations),
-                "total_time": sum(durations),
-                "average_time": sum(durations) / len(durations),
-                "min_time": min(durations),
-                "max_time": max(durations),
-            }
-
-        return stats
+        return {op: self._summarize(op) for op in self._aggregates}
+
+    def _summarize(self, operation: str) -> dict[str, float]:
+        """Build the statistics dictionary for one operation."""
+        count, total, min_time, max_time = self._aggregates[operation]
+        return {
+            "count": count,
+            "total_time": total,
+            "average_time": total / count,
+            "min_time": min_time,
+            "max_time": max_time,
+        }
 
     def reset_stats(self, operation: str | None = None) -> None:
         """Reset performance statistics.
@@ -388,10 +439,11 @@ class PerformanceMonitor:
             operation: Specific operation to reset (None for all)
         """
         if operation:
-            if operation in self.metrics:
-                del self.metrics[operation]
+            self.metrics.pop(operation, None)
+            self._aggregates.pop(operation, None)
         else:
             self.metrics.clear()
+            self._aggregates.clear()
 
         logger.info(f"Reset performance stats for {operation or 'all operations'}")
 
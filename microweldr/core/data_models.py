@@ -1,5 +1,6 @@
 """Fixed data models for structured data in MicroWeldr."""
 
+import math
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -106,10 +107,9 @@ class WeldPath:
         if len(self.points) < 2:
             return 0.0
 
-        total = 0.0
-        for i in range(1, len(self.points)):
-            total += self.points[i - 1].distance_to(self.points[i])
-        return total
+        # Sum segment lengths in C via math.dist rather than per-pair methods
+        coords = [(point.x, point.y) for point in self.points]
+        return math.fsum(map(math.dist, coords, coords[1:]))
 
     @property
     def bounds(self) -> tuple[Point, Point]:
@@ -3,7 +3,7 @@
 import functools
 import logging
 import traceback
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from typing import Any, TypeVar
 
@@ -191,12 +191,16 @@ class ErrorCollector:
         """Check if there are any warnings."""
         return len(self.warnings) > 0
 
+    def iter_errors(self) -> Iterator[str]:
+        """Iterate over error messages without building an intermediate list."""
+        for error in self.errors:
+            yield str(error)
+
     def raise_if_errors(self):
         """Raise a combined error if there are any errors."""
         if self.has_errors():
-            messages = [str(error) for error in self.errors]
             combined_message = "Multiple errors occurred:\n" + "\n".join(
-                f"- {msg}" for msg in messages
+                f"- {msg}" for msg in self.iter_errors()
             )
 
             combined_details = {
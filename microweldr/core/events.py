@@ -24,7 +24,8 @@ class EventType(Enum):
     PROGRESS = "progress"
 
 
-@dataclass
+# Events are created per weld point, so they carry no per-instance __dict__
+@dataclass(slots=True)
 class Event:
     """Base event class."""
 
@@ -43,6 +44,8 @@ class Event:
 class ParsingEvent(Event):
     """Event for file parsing operations."""
 
+    __slots__ = ()
+
     def __init__(self, action: str, file_path: str | Path, **kwargs):
         import time
 
@@ -58,6 +61,8 @@ class ParsingEvent(Event):
 class PathEvent(Event):
     """Event for path processing operations."""
 
+    __slots__ = ()
+
     def __init__(self, action: str, path_id: str, **kwargs):
         import time
 
@@ -73,6 +78,8 @@ class PathEvent(Event):
 class PointEvent(Event):
     """Event for point processing operations."""
 
+    __slots__ = ()
+
     def __init__(self, action: str, point_data: dict[str, Any], **kwargs):
         import time
 
@@ -88,6 +95,8 @@ class PointEvent(Event):
 class CurveEvent(Event):
     """Event for curve processing operations."""
 
+    __slots__ = ()
+
     def __init__(self, action: str, curve_type: str, **kwargs):
         import time
 
@@ -103,6 +112,8 @@ class CurveEvent(Event):
 class OutputEvent(Event):
     """Event for output generation operations."""
 
+    __slots__ = ()
+
     def __init__(self, action: str, output_type: str, file_path: str | Path, **kwargs):
         import time
 
@@ -123,6 +134,8 @@ class OutputEvent(Event):
 class ErrorEvent(Event):
     """Event for error conditions."""
 
+    __slots__ = ()
+
     def __init__(self, error_type: str, message: str, **kwargs):
         import time
 
@@ -138,6 +151,8 @@ class ErrorEvent(Event):
 class ValidationEvent(Event):
     """Event for validation operations."""
 
+    __slots__ = ()
+
     def __init__(self, action: str, validation_type: str, result: bool, **kwargs):
         import time
 
@@ -158,6 +173,8 @@ class ValidationEvent(Event):
 class ProgressEvent(Event):
     """Event for progress tracking."""
 
+    __slots__ = ()
+
     def __init__(
         self, stage: str, progress: float, total: float | None = None, **kwargs
     ):
@@ -35,7 +35,7 @@ class FallbackMode:
         self.fallback_active = True
         self.fallback_reason = reason
         self.manual_instructions = instructions or []
-        logger.warning(f"Fallback mode activated: {reason}")
+        logger.warning("Fallback mode activated: %s", reason)
 
     def deactivate(self):
         """Deactivate fallback mode."""
@@ -88,7 +88,7 @@ def with_fallback(
                     result = func(*args, **kwargs)
                     if failure_count > 0:
                         logger.info(
-                            f"Operation recovered after {failure_count} failures"
+                            "Operation recovered after %d failures", failure_count
                         )
                     return result
 
@@ -97,7 +97,7 @@ def with_fallback(
                     failure_count += 1
 
                     logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries + 1} failed: {e}"
+                        "Attempt %d/%d failed: %s", attempt + 1, max_retries + 1, e
                     )
 
                     if attempt < max_retries:
@@ -107,7 +107,8 @@ def with_fallback(
                     # All retries exhausted
                     if failure_count >= escalate_after:
                         logger.error(
-                            f"Operation failed after {max_retries + 1} attempts, using fallback"
+                            "Operation failed after %d attempts, using fallback",
+                            max_retries + 1,
                         )
 
                         if fallback_func:
@@ -115,7 +116,8 @@ def with_fallback(
                                 return fallback_func(*args, **kwargs)
                             except Exception as fallback_error:
                                 logger.error(
-                                    f"Fallback function also failed: {fallback_error}"
+                                    "Fallback function also failed: %s",
+                                    fallback_error,
                                 )
 
                         if fallback_value is not None:
@@ -132,17 +134,21 @@ def with_fallback(
 class ResilientPrusaLinkClient:
     """PrusaLink client with graceful degradation capabilities."""
 
-    def __init__(self, config_path: str | None = None):
+    def __init__(self, config_path: str | None = None, status_ttl: float = 1.0):
         """Initialize resilient client.
 
         Args:
             config_path: Path to secrets configuration
+            status_ttl: Seconds a printer status response is reused for
         """
         self.config_path = config_path
         self._client: PrusaLinkClient | None = None
         self._connection_healthy = True
         self._last_health_check = 0
         self._health_check_interval = 30  # seconds
+        self._status_ttl = status_ttl
+        self._cached_status: dict | None = None
+        self._cached_status_time = 0.0
 
     def _get_client(self) -> PrusaLinkClient | None:
         """Get PrusaLink client with health checking."""
@@ -161,7 +167,7 @@ class ResilientPrusaLinkClient:
                 self._client = PrusaLinkClient(self.config_path)
                 logger.info("PrusaLink client initialized successfully")
             except Exception as e:
-                logger.error(f"Failed to initialize PrusaLink client: {e}")
+                logger.error("Failed to initialize PrusaLink client: %s", e)
                 self._connection_healthy = False
                 return None
 
@@ -172,10 +178,10 @@ class ResilientPrusaLinkClient:
         try:
             if self._client:
                 # Quick health check
-                self._client.get_status()
+                self._client.get_printer_status()
                 self._connection_healthy = True
         except Exception as e:
-            logger.warning(f"PrusaLink health check failed: {e}")
+            logger.warning("PrusaLink health check failed: %s", e)
             self._connection_healthy = False
             self._client = None
 
@@ -185,7 +191,11 @@ class ResilientPrusaLinkClient:
         retry_delay=2.0,
     )
     def upload_file(
-        self, file_path: str, filename: str | None = None, auto_start: bool = False
+        self,
+        file_path: str,
+        filename: str | None = None,
+        auto_start: bool = False,
+        progress_callback: Callable[[int], None] | None = None,
     ) -> dict:
         """Upload file with fallback to manual instructions.
 
@@ -193,15 +203,22 @@ class ResilientPrusaLinkClient:
             file_path: Path to file to upload
             filename: Target filename (optional)
             auto_start: Whether to start print automatically
+            progress_callback: Called with the bytes sent after each chunk
 
         Returns:
             Upload result or fallback instructions
         """
+        self.invalidate_status_cache()
         client = self._get_client()
         if not client:
             return self._manual_upload_fallback(file_path, filename)
 
-        return client.upload_file(file_path, filename, auto_start=auto_start)
+        return client.upload_gcode(
+            file_path,
+            remote_filename=filename,
+            auto_start=auto_start,
+            progress_callback=progress_callback,
+        )
 
     def _manual_upload_fallback(
         self, file_path: str, filename: str | None = None
@@ -237,22 +254,46 @@ class ResilientPrusaLinkClient:
             "target_name": target_name,
         }
 
+    def get_status(self) -> dict:
+        """Get printer status with fallback.
+
+        Successful responses are reused for ``status_ttl`` seconds so callers
+        needing several views of the printer state share one HTTP round-trip.
+        """
+        now = time.monotonic()
+        if (
+            self._cached_status is not None
+            and now - self._cached_status_time < self._status_ttl
+        ):
+            return self._cached_status
+
+        status = self._fetch_status()
+        if not status.get("fallback"):
+            self._cached_status = status
+            self._cached_status_time = now
+        return status
+
+    def invalidate_status_cache(self):
+        """Drop the cached printer status so the next read hits the printer."""
+        self._cached_status = None
+
     @with_fallback(
         exceptions=(PrusaLinkError,),
         fallback_value={"state": "Unknown", "fallback": True},
         max_retries=1,
     )
-    def get_status(self) -> dict:
-        """Get printer status with fallback."""
+    def _fetch_status(self) -> dict:
+        """Fetch printer status from the printer."""
         client = self._get_client()
         if not client:
             return {"state": "Disconnected", "fallback": True}
 
-        return client.get_status()
+        return client.get_printer_status()
 
     @with_fallback(exceptions=(PrusaLinkError,), fallback_value=False, max_retries=1)
     def start_print(self, filename: str) -> bool:
         """Start print with fallback to manual instructions."""
+        self.invalidate_status_cache()
         client = self._get_client()
         if not client:
             self._manual_start_fallback(filename)
@@ -281,6 +322,7 @@ class ResilientPrusaLinkClient:
     @with_fallback(exceptions=(PrusaLinkError,), fallback_value=False, max_retries=1)
     def stop_print(self) -> bool:
         """Stop print with fallback to manual instructions."""
+        self.invalidate_status_cache()
         client = self._get_client()
         if not client:
             self._manual_stop_fallback()
@@ -323,16 +365,16 @@ def safe_file_operation(operation: str):
                 return result
 
             except Exception as e:
-                logger.error(f"File operation '{operation}' failed: {e}")
+                logger.error("File operation '%s' failed: %s", operation, e)
 
                 # Clean up any temporary files
                 for temp_file in temp_files:
                     try:
                         Path(temp_file).unlink(missing_ok=True)
-                        logger.debug(f"Cleaned up temporary file: {temp_file}")
+                        logger.debug("Cleaned up temporary file: %s", temp_file)
                     except Exception as cleanup_error:
                         logger.warning(
-                            f"Failed to clean up {temp_file}: {cleanup_error}"
+                            "Failed to clean up %s: %s", temp_file, cleanup_error
                         )
 
                 raise
@@ -5,13 +5,41 @@ import platform
 import shutil
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .graceful_degradation import ResilientPrusaLinkClient
 
+# Optional memory monitoring
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Sections every configuration file must define
+_REQUIRED_CONFIG_SECTIONS = frozenset({"printer", "temperatures", "normal_welds"})
+
+# Check statuses that warrant a recommendation
+_PROBLEM_STATUSES = frozenset({"warning", "error"})
+
+
+@lru_cache(maxsize=1)
+def _platform_info() -> dict[str, str]:
+    """Collect platform details once; they cannot change during a process."""
+    return {
+        "platform": platform.platform(),
+        "python_version": platform.python_version(),
+        "architecture": platform.architecture()[0],
+        "processor": platform.processor() or "Unknown",
+        "hostname": platform.node(),
+    }
+
 
 class HealthChecker:
     """Comprehensive system health checker."""
@@ -35,21 +63,21 @@ class HealthChecker:
         self.warnings.clear()
         self.errors.clear()
 
-        # Core system checks
-        self.checks["python"] = self._check_python_version()
-        self.checks["dependencies"] = self._check_dependencies()
-        self.checks["filesystem"] = self._check_filesystem_access()
-        self.checks["memory"] = self._check_memory_usage()
-        self.checks["disk_space"] = self._check_disk_space()
-
-        # Application-specific checks
-        self.checks["configuration"] = self._check_configuration()
-        self.checks["logging"] = self._check_logging_system()
-        self.checks["validation"] = self._check_validation_tools()
+        # Start the printer query first so the network round trip overlaps
+        # with the local checks below
+        pending_status = None
+        if secrets_path and Path(secrets_path).exists():
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending_status = executor.submit(
+                    self._fetch_printer_status, secrets_path
+                )
+                self._run_local_checks()
+        else:
+            self._run_local_checks()
 
         # Printer connectivity (if secrets provided)
-        if secrets_path and Path(secrets_path).exists():
-            self.checks["printer"] = self._check_printer_connectivity(secrets_path)
+        if pending_status is not None:
+            self.checks["printer"] = self._check_printer_connectivity(pending_status)
         else:
             self.checks["printer"] = {
                 "status": "skipped",
@@ -69,6 +97,20 @@ class HealthChecker:
             "recommendations": self._generate_recommendations(),
         }
 
+    def _run_local_checks(self) -> None:
+        """Run the checks that only inspect the local machine."""
+        # Core system checks
+        self.checks["python"] = self._check_python_version()
+        self.checks["dependencies"] = self._check_dependencies()
+        self.checks["filesystem"] = self._check_filesystem_access()
+        self.checks["memory"] = self._check_memory_usage()
+        self.checks["disk_space"] = self._check_disk_space()
+
+        # Application-specific checks
+        self.checks["configuration"] = self._check_configuration()
+        self.checks["logging"] = self._check_logging_system()
+        self.checks["validation"] = self._check_validation_tools()
+
     def _check_python_version(self) -> dict[str, Any]:
         """Check Python version compatibility."""
         version_info = sys.version_info
@@ -209,9 +251,13 @@ class HealthChecker:
 
     def _check_memory_usage(self) -> dict[str, Any]:
         """Check memory usage."""
-        try:
-            import psutil
+        if not PSUTIL_AVAILABLE:
+            return {
+                "status": "skipped",
+                "message": "psutil not available for memory checking",
+            }
 
+        try:
             memory = psutil.virtual_memory()
 
             available_gb = memory.available / (1024**3)
@@ -241,11 +287,6 @@ class HealthChecker:
                     "message": f"{available_gb:.1f}GB memory available",
                 }
 
-        except ImportError:
-            return {
-                "status": "skipped",
-                "message": "psutil not available for memory checking",
-            }
         except Exception as e:
             return {"status": "error", "message": f"Memory check failed: {e}"}
 
@@ -299,8 +340,7 @@ class HealthChecker:
                     config = toml.load(config_path)
 
                     # Basic structure validation
-                    required_sections = ["printer", "temperatures", "normal_welds"]
-                    missing_sections = [s for s in required_sections if s not in config]
+                    missing_sections = sorted(_REQUIRED_CONFIG_SECTIONS - config.keys())
 
                     if missing_sections:
                         config_issues.append(
@@ -391,11 +431,21 @@ class HealthChecker:
                 "message": "All validation tools available",
             }
 
-    def _check_printer_connectivity(self, secrets_path: str) -> dict[str, Any]:
-        """Check printer connectivity."""
+    @staticmethod
+    def _fetch_printer_status(secrets_path: str) -> dict[str, Any]:
+        """Query printer status; safe to run off the main thread."""
+        return ResilientPrusaLinkClient(secrets_path).get_status()
+
+    def _check_printer_connectivity(
+        self, pending_status: "Future[dict[str, Any]]"
+    ) -> dict[str, Any]:
+        """Check printer connectivity.
+
+        Args:
+            pending_status: Future resolving to the printer status response
+        """
         try:
-            client = ResilientPrusaLinkClient(secrets_path)
-            status = client.get_status()
+            status = pending_status.result()
 
             if status.get("fallback"):
                 self.warnings.append("Printer connection degraded (fallback mode)")
@@ -422,14 +472,7 @@ class HealthChecker:
 
     def _get_system_info(self) -> dict[str, Any]:
         """Get system information."""
-        return {
-            "platform": platform.platform(),
-            "python_version": platform.python_version(),
-            "architecture": platform.architecture()[0],
-            "processor": platform.processor() or "Unknown",
-            "hostname": platform.node(),
-            "working_directory": str(Path.cwd()),
-        }
+        return {**_platform_info(), "working_directory": str(Path.cwd())}
 
     def _determine_overall_health(self) -> str:
         """Determine overall system health status."""
@@ -452,7 +495,7 @@ class HealthChecker:
 
         # Memory recommendations
         memory_check = self.checks.get("memory", {})
-        if memory_check.get("status") in ["warning", "error"]:
+        if memory_check.get("status") in _PROBLEM_STATUSES:
             recommendations.append("Close other applications to free up memory")
             recommendations.append(
                 "Consider processing smaller SVG files or using caching"
@@ -460,7 +503,7 @@ class HealthChecker:
 
         # Disk space recommendations
         disk_check = self.checks.get("disk_space", {})
-        if disk_check.get("status") in ["warning", "error"]:
+        if disk_check.get("status") in _PROBLEM_STATUSES:
             recommendations.append("Free up disk space by removing unnecessary files")
             recommendations.append(
                 "Consider using a different working directory with more space"
@@ -498,7 +541,7 @@ class HealthChecker:
 
         # Security recommendations
         secrets_check = self.checks.get("secrets", {})
-        if secrets_check.get("status") in ["warning", "error"]:
+        if secrets_check.get("status") in _PROBLEM_STATUSES:
             recommendations.append("Review and fix secrets file security issues")
             recommendations.append(
                 "Ensure secrets.toml has restricted file permissions (600)"
@@ -545,7 +588,7 @@ def monitor_system_health(interval: int = 300, log_results: bool = True) -> None
     """
     checker = HealthChecker()
 
-    logger.info(f"Starting system health monitoring (interval: {interval}s)")
+    logger.info("Starting system health monitoring (interval: %ss)", interval)
 
     try:
         while True:
@@ -560,13 +603,15 @@ def monitor_system_health(interval: int = 300, log_results: bool = True) -> None
                 warning_count = len(health_status["warnings"])
 
                 logger.info(
-                    f"Health check: {overall} "
-                    f"({error_count} errors, {warning_count} warnings)"
+                    "Health check: %s (%d errors, %d warnings)",
+                    overall,
+                    error_count,
+                    warning_count,
                 )
 
                 if health_status["errors"]:
                     for error in health_status["errors"]:
-                        logger.error(f"Health issue: {error}")
+                        logger.error("Health issue: %s", error)
 
             # Sleep until next check
             elapsed = time.time() - start_time
@@ -576,7 +621,7 @@ def monitor_system_health(interval: int = 300, log_results: bool = True) -> None
     except KeyboardInterrupt:
         logger.info("Health monitoring stopped by user")
     except Exception as e:
-        logger.error(f"Health monitoring failed: {e}")
+        logger.error("Health monitoring failed: %s", e)
 
 
 def generate_health_report(output_path: str | None = None) -> str:
@@ -639,6 +684,6 @@ def generate_health_report(output_path: str | None = None) -> str:
 
     if output_path:
         Path(output_path).write_text(report)
-        logger.info(f"Health report saved: {output_path}")
+        logger.info("Health report saved: %s", output_path)
 
     return report
@@ -80,6 +80,10 @@ def setup_logging(
     # Clear existing handlers
     root_logger.handlers.clear()
 
+    # Nothing else to configure when there is no destination for the output
+    if not console and not log_file:
+        return
+
     # Create formatter
     formatter = WeldFormatter()
 
@@ -1,9 +1,10 @@
 """Centralized printer service for consistent API usage and status handling."""
 
 import logging
+import time
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from ..prusalink.client import PrusaLinkClient
 
@@ -23,61 +24,60 @@ class PrinterState(Enum):
     IDLE = "Idle"
 
 
-class PrinterStatus:
-    """Standardized printer status representation."""
-
-    def __init__(self, raw_status: dict[str, Any]):
-        """Initialize from raw status data."""
-        self.raw_status = raw_status
-        self._parse_status()
-
-    def _parse_status(self):
-        """Parse raw status into standardized format."""
+# Normalized state lookup; includes common firmware spelling variations
+_STATE_MAPPING = {
+    "OPERATIONAL": PrinterState.OPERATIONAL,
+    "PRINTING": PrinterState.PRINTING,
+    "PAUSED": PrinterState.PAUSED,
+    "FINISHED": PrinterState.FINISHED,
+    "FINISH": PrinterState.FINISHED,  # Some printers use this
+    "ERROR": PrinterState.ERROR,
+    "CANCELLED": PrinterState.CANCELLED,
+    "CANCELED": PrinterState.CANCELLED,  # US spelling
+    "IDLE": PrinterState.IDLE,
+}
+
+_READY_STATES = frozenset(
+    {PrinterState.OPERATIONAL, PrinterState.FINISHED, PrinterState.IDLE}
+)
+
+
+class PrinterStatus(NamedTuple):
+    """Standardized, immutable printer status representation."""
+
+    raw_status: dict[str, Any]
+    state: PrinterState
+    bed_temp: float
+    bed_target: float
+    nozzle_temp: float
+    nozzle_target: float
+    current_file: str | None
+    progress: float
+
+    @classmethod
+    def from_raw(cls, raw_status: dict[str, Any]) -> "PrinterStatus":
+        """Parse a raw API status response into a PrinterStatus."""
         # Handle different API response formats
-        printer_info = self.raw_status.get("printer", {})
-
-        # Normalize state
-        raw_state = printer_info.get("state", "Unknown")
-        self.state = self._normalize_state(raw_state)
-
-        # Temperature data
-        self.bed_temp = printer_info.get("temp_bed", 0.0)
-        self.bed_target = printer_info.get("target_bed", 0.0)
-        self.nozzle_temp = printer_info.get("temp_nozzle", 0.0)
-        self.nozzle_target = printer_info.get("target_nozzle", 0.0)
-
-        # Job information
-        job_info = self.raw_status.get("job", {})
-        self.current_file = job_info.get("file", {}).get("name")
-        self.progress = job_info.get("progress", 0.0)
-
-    def _normalize_state(self, raw_state: str) -> PrinterState:
-        """Normalize state string to PrinterState enum."""
-        state_upper = raw_state.upper()
-
-        # Handle common variations
-        state_mapping = {
-            "OPERATIONAL": PrinterState.OPERATIONAL,
-            "PRINTING": PrinterState.PRINTING,
-            "PAUSED": PrinterState.PAUSED,
-            "FINISHED": PrinterState.FINISHED,
-            "FINISH": PrinterState.FINISHED,  # Some printers use this
-            "ERROR": PrinterState.ERROR,
-            "CANCELLED": PrinterState.CANCELLED,
-            "CANCELED": PrinterState.CANCELLED,  # US spelling
-            "IDLE": PrinterState.IDLE,
-        }
-
-        return state_mapping.get(state_upper, PrinterState.UNKNOWN)
+        printer_info = raw_status.get("printer", {})
+        job_info = raw_status.get("job", {})
+
+        return cls(
+            raw_status=raw_status,
+            state=_STATE_MAPPING.get(
+                printer_info.get("state", "Unknown").upper(), PrinterState.UNKNOWN
+            ),
+            bed_temp=printer_info.get("temp_bed", 0.0),
+            bed_target=printer_info.get("target_bed", 0.0),
+            nozzle_temp=printer_info.get("temp_nozzle", 0.0),
+            nozzle_target=printer_info.get("target_nozzle", 0.0),
+            current_file=job_info.get("file", {}).get("name"),
+            progress=job_info.get("progress", 0.0),
+        )
 
     @property
     def is_ready_for_job(self) -> bool:
         """Check if printer is ready to accept new jobs."""
-        return self.state in [
-            PrinterState.OPERATIONAL,
-            PrinterState.FINISHED,
-            PrinterState.IDLE,
-        ]
+        return self.state in _READY_STATES
 
     @property
     def is_printing(self) -> bool:
@@ -157,7 +157,7 @@ class PrinterService:
         """Get current printer status."""
         try:
             raw_status = self.client.get_printer_status()
-            status = PrinterStatus(raw_status)
+            status = PrinterStatus.from_raw(raw_status)
             self._last_status = status
             return status
         except Exception as e:
@@ -174,8 +174,6 @@ class PrinterService:
         Returns:
             True if printer becomes ready, False if timeout
         """
-        import time
-
         start_time = time.time()
 
         while time.time() - start_time < timeout:
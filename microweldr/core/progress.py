@@ -44,7 +44,9 @@ class ProgressReporter:
 
         self.current = 0
         self.start_time = time.time()
-        self.last_update = 0
+        # Renders are coalesced on a monotonic clock so bursts of updates
+        # (and wall-clock adjustments) cost at most one frame per interval
+        self.last_update = float("-inf")
         self.update_interval = 0.1  # Update at most every 100ms
         self._lock = threading.Lock()
         self._closed = False
@@ -68,17 +70,7 @@ class ProgressReporter:
                 return
 
             self.current = min(self.current + increment, self.total)
-            current_time = time.time()
-
-            # Throttle updates to avoid excessive output
-            if (
-                current_time - self.last_update < self.update_interval
-                and self.current < self.total
-            ):
-                return
-
-            self.last_update = current_time
-            self._render(message)
+            self._render_throttled(message)
 
     def set_progress(self, current: int, message: str | None = None) -> None:
         """Set absolute progress.
@@ -92,7 +84,22 @@ class ProgressReporter:
                 return
 
             self.current = min(max(current, 0), self.total)
-            self._render(message)
+            self._render_throttled(message)
+
+    def _render_throttled(self, message: str | None = None) -> None:
+        """Render unless a frame was drawn within the update interval.
+
+        Args:
+            message: Optional status message
+        """
+        now = time.monotonic()
+
+        # Throttle updates to avoid excessive output; always draw completion
+        if now - self.last_update < self.update_interval and self.current < self.total:
+            return
+
+        self.last_update = now
+        self._render(message)
 
     def _render(self, message: str | None = None) -> None:
         """Render progress bar."""
@@ -337,13 +337,14 @@ class SafetyValidator:
 
 
 def validate_weld_operation(
-    weld_paths: list[WeldPath], config: dict
+    weld_paths: list[WeldPath], config: dict, fail_fast: bool = False
 ) -> tuple[list[str], list[str]]:
     """Validate complete weld operation for safety.
 
     Args:
         weld_paths: List of weld paths to validate
         config: Configuration dictionary
+        fail_fast: Stop at the first error instead of checking every path
 
     Returns:
         Tuple of (warnings, errors)
@@ -352,24 +353,22 @@ def validate_weld_operation(
         SafetyError: If critical safety violations are found
     """
     validator = SafetyValidator()
-    all_warnings = []
-    all_errors = []
 
-    # Validate configuration
-    config_warnings, config_errors = validator.validate_config(config)
-    all_warnings.extend(config_warnings)
-    all_errors.extend(config_errors)
+    # All checks accumulate into the validator's own lists, so nothing needs
+    # to be copied or merged afterwards
+    validator.validate_config(config)
+    all_warnings = validator.warnings
+    all_errors = validator.errors
 
-    # Validate all weld paths
+    # Validate all weld paths (none at all if the config already failed)
     for path in weld_paths:
+        if fail_fast and all_errors:
+            break
         try:
             validator.validate_weld_path(path)
         except SafetyError as e:
             all_errors.append(str(e))
 
-    # Add any additional warnings from point validation
-    all_warnings.extend(validator.warnings)
-
     # Log summary
     if all_errors:
         logger.error(f"Safety validation failed with {len(all_errors)} errors")
@@ -173,7 +173,7 @@ class SecretsConfig:
         """
         if self._config is None:
             self.load()
-        return self._config.as_dict()
+        return dict(self._config)
 
 
 # Global instance for easy access
@@ -5,7 +5,7 @@ from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from ..core.unified_config import UnifiedConfig
+from ..core.unified_config import get_main_config
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +28,8 @@ class DXFPointIterator:
             dot_spacing: Spacing between points in mm. If None, uses unified config.
         """
         if dot_spacing is None:
-            config = UnifiedConfig()
-            main_config = config.get_main_config()
+            # Shared instance: config files are read once per process
+            main_config = get_main_config()
             self.dot_spacing = main_config.get("normal_welds", {}).get(
                 "dot_spacing", 1.0
             )
@@ -58,10 +58,14 @@ class DXFPointIterator:
 
             logger.info(f"DXF file contains {len(weld_paths)} paths")
 
+            # Release each parsed path once its points are yielded, so a
+            # streaming consumer only keeps the remaining paths alive
+            weld_paths.reverse()
             total_points = 0
-            for path in weld_paths:
+            while weld_paths:
+                path = weld_paths.pop()
                 path_id = path.svg_id or f"path_{total_points}"
-                logger.debug(f"Path {path_id}: {len(path.points)} points")
+                logger.debug("Path %s: %d points", path_id, len(path.points))
 
                 for point in path.points:
                     yield {
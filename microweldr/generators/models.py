@@ -1,5 +1,6 @@
 """Data models for point generation and welding operations."""
 
+import math
 from dataclasses import dataclass
 
 from ..core.constants import (
@@ -122,15 +123,9 @@ class WeldPath:
         if len(self.points) < 2:
             return 0.0
 
-        total_length = 0.0
-        for i in range(1, len(self.points)):
-            prev_point = self.points[i - 1]
-            curr_point = self.points[i]
-            dx = curr_point.x - prev_point.x
-            dy = curr_point.y - prev_point.y
-            total_length += (dx**2 + dy**2) ** 0.5
-
-        return total_length
+        # Sum segment lengths in C via math.dist rather than a Python loop
+        coords = [(point.x, point.y) for point in self.points]
+        return math.fsum(map(math.dist, coords, coords[1:]))
 
     def get_bounds(self) -> tuple[float, float, float, float]:
         """Get bounding box of the path.
@@ -1,9 +1,13 @@
 """Output generators for G-code, animated GIF, and Bambu 3MF files."""
 
-from .bambu_3mf_subscriber import Bambu3mfSubscriber
-from .gif_animation_subscriber import GIFAnimationSubscriber
-from .streaming_gcode_subscriber import FilenameError, StreamingGCodeSubscriber
-from .weld_renderer import render_weld_overview
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .bambu_3mf_subscriber import Bambu3mfSubscriber
+    from .gif_animation_subscriber import GIFAnimationSubscriber
+    from .streaming_gcode_subscriber import FilenameError, StreamingGCodeSubscriber
+    from .weld_renderer import render_weld_overview
 
 __all__ = [
     "Bambu3mfSubscriber",
@@ -12,3 +16,27 @@ __all__ = [
     "StreamingGCodeSubscriber",
     "render_weld_overview",
 ]
+
+# Submodule providing each public name; imported on first access so that
+# pulling in one output (or just the CLI parser) does not load PIL/bambuuzle
+_LAZY_EXPORTS = {
+    "Bambu3mfSubscriber": ".bambu_3mf_subscriber",
+    "FilenameError": ".streaming_gcode_subscriber",
+    "GIFAnimationSubscriber": ".gif_animation_subscriber",
+    "StreamingGCodeSubscriber": ".streaming_gcode_subscriber",
+    "render_weld_overview": ".weld_renderer",
+}
+
+
+def __getattr__(name: str):
+    """Import public output classes on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
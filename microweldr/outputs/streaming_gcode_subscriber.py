@@ -9,6 +9,13 @@ from ..processors.subscribers import EventSubscriber
 
 logger = logging.getLogger(__name__)
 
+# Write buffer size for G-code output files (1 MiB)
+GCODE_WRITE_BUFFER = 1024 * 1024
+
+
+# Longest G-code filename Prusa printers handle reliably, extension included
+MAX_GCODE_FILENAME_LENGTH = 31
+
 
 class FilenameError(Exception):
     """Raised when filename validation fails."""
@@ -16,6 +23,25 @@ class FilenameError(Exception):
     pass
 
 
+def validate_gcode_filename(output_path: str | Path) -> None:
+    """Validate G-code filename length for Prusa printer compatibility.
+
+    Args:
+        output_path: Path of the G-code file to be written
+
+    Raises:
+        FilenameError: If the filename is longer than the printer supports
+    """
+    filename = Path(output_path).name
+    if len(filename) > MAX_GCODE_FILENAME_LENGTH:
+        raise FilenameError(
+            f"G-code filename '{filename}' is {len(filename)} characters long, "
+            f"which exceeds the {MAX_GCODE_FILENAME_LENGTH} character limit for Prusa printers. "
+            f"Long filenames can cause display issues, file selection errors, or transfer failures. "
+            f"Please use a shorter filename (max {MAX_GCODE_FILENAME_LENGTH} characters including .gcode extension)."
+        )
+
+
 class StreamingGCodeSubscriber(EventSubscriber):
     """Generates G-code output from events in streaming mode.
 
@@ -109,7 +135,7 @@ class StreamingGCodeSubscriber(EventSubscriber):
             self.file_handle.write(
                 f"; Starting path: {self.current_path_id} ({self.current_weld_type})\n"
             )
-            logger.debug(f"StreamingGCode: Started path {self.current_path_id}")
+            logger.debug("StreamingGCode: Started path %s", self.current_path_id)
 
         elif action == "point_added":
             # Handle point added to path
@@ -126,9 +152,8 @@ class StreamingGCodeSubscriber(EventSubscriber):
             # Write path completion comment
             if self.file_handle:
                 self.file_handle.write(f"; Completed path: {self.current_path_id}\n\n")
-                self.file_handle.flush()  # Ensure data is written
             self.total_paths_processed += 1
-            logger.debug(f"StreamingGCode: Completed path {self.current_path_id}")
+            logger.debug("StreamingGCode: Completed path %s", self.current_path_id)
 
     def _handle_point_event(self, event: Event) -> None:
         """Handle point processing event - streaming mode."""
@@ -161,8 +186,12 @@ class StreamingGCodeSubscriber(EventSubscriber):
             # Validate filename length for Prusa compatibility
             self._validate_filename()
 
-            # Open file and write complete initialization sequence
-            self.file_handle = open(self.output_path, "w", encoding="utf-8")  # noqa: SIM115
+            # Open file and write complete initialization sequence. A large
+            # write buffer lets the OS receive G-code in big chunks; the file
+            # is flushed once when it is finalized and closed.
+            self.file_handle = open(  # noqa: SIM115
+                self.output_path, "w", encoding="utf-8", buffering=GCODE_WRITE_BUFFER
+            )
             self._write_gcode_header()
             self._write_calibration_and_heating()
             if self.include_user_pause:
@@ -347,16 +376,7 @@ class StreamingGCodeSubscriber(EventSubscriber):
 
     def _validate_filename(self) -> None:
         """Validate G-code filename length for Prusa printer compatibility."""
-        filename = self.output_path.name
-        MAX_FILENAME_LENGTH = 31  # Conservative limit for Prusa compatibility
-
-        if len(filename) > MAX_FILENAME_LENGTH:
-            raise FilenameError(
-                f"G-code filename '{filename}' is {len(filename)} characters long, "
-                f"which exceeds the {MAX_FILENAME_LENGTH} character limit for Prusa printers. "
-                f"Long filenames can cause display issues, file selection errors, or transfer failures. "
-                f"Please use a shorter filename (max {MAX_FILENAME_LENGTH} characters including .gcode extension)."
-            )
+        validate_gcode_filename(self.output_path)
 
     def _write_calibration_and_heating(self) -> None:
         """Write calibration and heating sequence."""
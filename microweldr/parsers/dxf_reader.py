@@ -23,6 +23,9 @@ from .file_readers import FileReaderPublisher
 
 logger = logging.getLogger(__name__)
 
+# Lowercased suffixes accepted by can_read_file, built once at import
+_SUPPORTED_SUFFIXES = frozenset({".dxf"})
+
 try:
     import ezdxf
 
@@ -49,7 +52,7 @@ class DXFReader(FileReaderPublisher):
 
     def can_read_file(self, file_path: Path) -> bool:
         """Check if this reader can handle the given file."""
-        return file_path.suffix.lower() in self.get_supported_extensions()
+        return file_path.suffix.lower() in _SUPPORTED_SUFFIXES
 
     @handle_errors(
         error_types={
@@ -155,7 +158,7 @@ class DXFReader(FileReaderPublisher):
             # Return a special marker that indicates this is a polyline to be processed later
             return {"type": "polyline", "entity": entity, "layer": layer}
         else:
-            logger.debug(f"Unsupported entity type: {entity_type}")
+            logger.debug("Unsupported entity type: %s", entity_type)
             return None
 
     def _parse_line(self, entity, layer: str) -> LineEntity:
@@ -538,7 +541,7 @@ class DXFReader(FileReaderPublisher):
                     "ref",
                 ]
                 if any(pattern in layer.lower() for pattern in construction_patterns):
-                    logger.debug(f"Skipping construction polyline on layer: {layer}")
+                    logger.debug("Skipping construction polyline on layer: %s", layer)
                     continue
 
                 # Determine weld type based on layer name
@@ -565,7 +568,7 @@ class DXFReader(FileReaderPublisher):
 
             # Skip construction entities
             if entity.is_construction:
-                logger.debug(f"Skipping construction entity on layer: {entity.layer}")
+                logger.debug("Skipping construction entity on layer: %s", entity.layer)
                 continue
 
             # Determine weld type based on layer name
@@ -591,7 +594,7 @@ class DXFReader(FileReaderPublisher):
                     data_path = entity.to_weld_path(
                         segments=segments, weld_type=weld_type
                     )
-                    logger.debug(f"Arc converted to {len(data_path.points)} points")
+                    logger.debug("Arc converted to %d points", len(data_path.points))
                 elif isinstance(entity, CircleEntity):
                     # Calculate circle circumference and determine segments based on dot spacing
                     circumference = 2 * math.pi * entity.radius
@@ -181,11 +181,15 @@ class MultiFileReader:
 
     def __init__(self):
         self._readers: list[FileReaderPublisher] = []
+        # First registered reader per lowercased extension, for O(1) routing
+        self._readers_by_extension: dict[str, FileReaderPublisher] = {}
         self._subscribers: set[FileReaderSubscriber] = set()
 
     def register_reader(self, reader: FileReaderPublisher) -> None:
         """Register a file reader."""
         self._readers.append(reader)
+        for extension in reader.get_supported_extensions():
+            self._readers_by_extension.setdefault(extension.lower(), reader)
 
         # Subscribe all current subscribers to the new reader
         for subscriber in self._subscribers:
@@ -213,6 +217,12 @@ class MultiFileReader:
 
     def get_reader_for_file(self, file_path: Path) -> FileReaderPublisher | None:
         """Get the appropriate reader for a file."""
+        reader = self._readers_by_extension.get(Path(file_path).suffix.lower())
+        if reader is not None and reader.can_read_file(file_path):
+            return reader
+
+        # Fall back to asking each reader, for readers that accept files by
+        # more than their extension
         for reader in self._readers:
             if reader.can_read_file(file_path):
                 return reader
@@ -32,6 +32,15 @@ class SVGParser:
 
         return self._parse_elements(root)
 
+    def parse_string(self, svg_content: str) -> list[WeldPath]:
+        """Parse SVG markup that has already been read into memory."""
+        try:
+            root = ET.fromstring(svg_content)  # nosec B314 - Parsing trusted user SVG
+        except ET.ParseError as e:
+            raise SVGParseError(f"Invalid SVG file: {e}")
+
+        return self._parse_elements(root)
+
     def _parse_elements(self, root: ET.Element) -> list[WeldPath]:
         """Parse SVG elements and return weld paths."""
         # Define SVG namespace
@@ -13,6 +13,9 @@ from .file_readers import FileReaderPublisher
 
 logger = logging.getLogger(__name__)
 
+# Lowercased suffixes accepted by can_read_file, built once at import
+_SUPPORTED_SUFFIXES = frozenset({".svg"})
+
 
 class SVGReader(FileReaderPublisher):
     """SVG file reader that publishes weld paths."""
@@ -27,7 +30,7 @@ class SVGReader(FileReaderPublisher):
 
     def can_read_file(self, file_path: Path) -> bool:
         """Check if this reader can handle the given file."""
-        return file_path.suffix.lower() in self.get_supported_extensions()
+        return file_path.suffix.lower() in _SUPPORTED_SUFFIXES
 
     @handle_errors(
         error_types={
@@ -131,7 +134,7 @@ class SVGReader(FileReaderPublisher):
         elif tag == "use":
             return self._parse_use(elem, defs_elements, namespaces)
         else:
-            logger.debug(f"Unsupported SVG element: {tag}")
+            logger.debug("Unsupported SVG element: %s", tag)
             return []
 
     def _parse_path(self, elem: ET.Element) -> list[WeldPath]:
@@ -88,7 +88,7 @@ class OutlineSubscriber(EventSubscriber):
                 self.x_coords.append(float(x))
                 self.y_coords.append(float(y))
                 self.total_points += 1
-                logger.debug(f"OutlineSubscriber: Collected point ({x}, {y})")
+                logger.debug("OutlineSubscriber: Collected point (%s, %s)", x, y)
 
     def _handle_path_event(self, event: Event) -> None:
         """Handle path processing events."""
@@ -104,7 +104,7 @@ class OutlineSubscriber(EventSubscriber):
                 self.x_coords.append(float(x))
                 self.y_coords.append(float(y))
                 self.total_points += 1
-                logger.debug(f"OutlineSubscriber: Collected path point ({x}, {y})")
+                logger.debug("OutlineSubscriber: Collected path point (%s, %s)", x, y)
 
     def calculate_bounds_and_offset(self) -> tuple[float, float]:
         """Calculate bounding box and centering offset.
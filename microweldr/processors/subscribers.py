@@ -3,6 +3,7 @@
 import logging
 import time
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from ..core.constants import get_valid_weld_types
@@ -618,7 +619,18 @@ class ValidationSubscriber(EventSubscriber):  # noqa: F811
         )
 
     def get_validation_results(self) -> dict[str, Any]:
-        """Get comprehensive validation results."""
+        """Get comprehensive validation results.
+
+        ``path_stats`` is a read-only snapshot of the per-path statistics, so
+        results kept by the caller stay intact after ``reset()``.
+        """
+        valid_paths = 0
+        total_points = 0
+        for stats in self.path_stats.values():
+            if not stats["has_errors"]:
+                valid_paths += 1
+            total_points += stats["point_count"]
+
         return {
             "has_errors": len(self.validation_errors) > 0,
             "has_warnings": len(self.validation_warnings) > 0,
@@ -626,12 +638,10 @@ class ValidationSubscriber(EventSubscriber):  # noqa: F811
             "warnings": self.validation_warnings.copy(),
             "error_count": len(self.validation_errors),
             "warning_count": len(self.validation_warnings),
-            "path_stats": self.path_stats.copy(),
+            "path_stats": MappingProxyType(dict(self.path_stats)),
             "total_paths": len(self.path_stats),
-            "valid_paths": len(
-                [p for p in self.path_stats.values() if not p["has_errors"]]
-            ),
-            "total_points": sum(p["point_count"] for p in self.path_stats.values()),
+            "valid_paths": valid_paths,
+            "total_points": total_points,
         }
 
     def reset(self) -> None:
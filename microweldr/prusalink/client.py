@@ -1,9 +1,12 @@
 """PrusaLink API client for G-code submission."""
 
+import io
 import logging
+import os
 import time
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import requests
 from requests.auth import HTTPDigestAuth
@@ -22,6 +25,47 @@ from .exceptions import (
 logger = logging.getLogger(__name__)
 
 
+class _ProgressReader:
+    """Binary stream wrapper that reports each chunk read during an upload.
+
+    ``requests`` sizes the body with ``len()`` and http.client pulls it in
+    blocks with ``read()``, so the upload still streams with a fixed
+    Content-Length. ``tell()``/``seek()`` let digest auth rewind the body to
+    re-send it after a 401 challenge; bytes sent again after a rewind are
+    not reported twice.
+    """
+
+    def __init__(
+        self, stream: BinaryIO, size: int, callback: Callable[[int], None]
+    ) -> None:
+        self._stream = stream
+        self._size = size
+        self._callback = callback
+        self._position = stream.tell()
+        self._reported = self._position
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        return iter(lambda: self.read(8192), b"")
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._position = self._stream.seek(offset, whence)
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._stream.read(size)
+        self._position += len(chunk)
+        if self._position > self._reported:
+            self._callback(self._position - self._reported)
+            self._reported = self._position
+        return chunk
+
+
 class PrusaLinkClient:
     """Client for interacting with PrusaLink API."""
 
@@ -39,6 +83,32 @@ class PrusaLinkClient:
         self.auth = HTTPDigestAuth(self.config["username"], password)
         self.timeout = self.config.get("timeout", 30)
 
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session shared by all calls so the connection is kept alive.
+
+        Created on first use, which also covers clients that are assembled
+        without going through ``__init__``.
+        """
+        session = self.__dict__.get("_session")
+        if session is None:
+            session = self._session = requests.Session()
+        return session
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        session = self.__dict__.pop("_session", None)
+        if session is not None:
+            session.close()
+
+    def __enter__(self) -> "PrusaLinkClient":
+        """Use the client as a context manager that closes its session."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the HTTP session."""
+        self.close()
+
     def _load_config(self, config_path: str | None = None) -> dict[str, Any]:
         """Load configuration using hierarchical config loading or specific file."""
         try:
@@ -71,7 +141,7 @@ class PrusaLinkClient:
             True if connection successful, False otherwise.
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/version", auth=self.auth, timeout=self.timeout
             )
 
@@ -98,7 +168,7 @@ class PrusaLinkClient:
             PrusaLinkAuthError: If authentication fails.
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/v1/info", auth=self.auth, timeout=self.timeout
             )
 
@@ -123,7 +193,7 @@ class PrusaLinkClient:
             Dictionary containing storage information.
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/v1/storage", auth=self.auth, timeout=self.timeout
             )
 
@@ -143,20 +213,24 @@ class PrusaLinkClient:
 
     def upload_gcode(
         self,
-        gcode_path: str,
+        gcode_path: str | bytes,
         storage: str | None = None,
         remote_filename: str | None = None,
         auto_start: bool | None = None,
         overwrite: bool = False,
+        progress_callback: Callable[[int], None] | None = None,
     ) -> dict[str, Any]:
         """Upload G-code file to printer.
 
         Args:
-            gcode_path: Path to local G-code file.
+            gcode_path: Path to local G-code file, or the G-code itself as bytes.
             storage: Target storage ("local" or "usb"). If None, uses config default.
-            remote_filename: Name for file on printer. If None, uses original filename.
+            remote_filename: Name for file on printer. If None, uses original
+                filename. Required when uploading bytes.
             auto_start: Whether to start printing after upload. If None, uses config default.
             overwrite: Whether to overwrite existing files.
+            progress_callback: Called with the number of bytes sent after
+                each chunk of the upload.
 
         Returns:
             Dictionary containing upload response.
@@ -166,16 +240,23 @@ class PrusaLinkClient:
             PrusaLinkConnectionError: If connection fails.
             PrusaLinkAuthError: If authentication fails.
         """
-        gcode_file = Path(gcode_path)
-        if not gcode_file.exists():
-            raise PrusaLinkUploadError(f"G-code file not found: {gcode_path}")
+        in_memory = isinstance(gcode_path, bytes)
+        if in_memory:
+            if remote_filename is None:
+                raise PrusaLinkUploadError(
+                    "A remote filename is required when uploading G-code bytes"
+                )
+        else:
+            gcode_file = Path(gcode_path)
+            if not gcode_file.exists():
+                raise PrusaLinkUploadError(f"G-code file not found: {gcode_path}")
+
+            if remote_filename is None:
+                remote_filename = gcode_file.name
 
         if storage is None:
             storage = self.config.get("default_storage", "local")
 
-        if remote_filename is None:
-            remote_filename = gcode_file.name
-
         if auto_start is None:
             auto_start = self.config.get("auto_start_print", False)
 
@@ -186,14 +267,19 @@ class PrusaLinkClient:
             "Overwrite": "?1" if overwrite else "?0",
         }
 
-        # Read file content
-        try:
-            with open(gcode_file, "rb") as f:
-                file_content = f.read()
-        except Exception as e:
-            raise PrusaLinkUploadError(f"Failed to read G-code file: {e}")
+        # Stream the body from the open file handle instead of reading the
+        # whole G-code into memory first; Content-Length comes from the stat.
+        if in_memory:
+            gcode_stream = io.BytesIO(gcode_path)
+            file_size = len(gcode_path)
+        else:
+            try:
+                gcode_stream = open(gcode_file, "rb")  # noqa: SIM115
+                file_size = os.fstat(gcode_stream.fileno()).st_size
+            except OSError as e:
+                raise PrusaLinkUploadError(f"Failed to read G-code file: {e}")
 
-        headers["Content-Length"] = str(len(file_content))
+        headers["Content-Length"] = str(file_size)
 
         # Upload file
         url = f"{self.base_url}/api/v1/files/{storage}/{remote_filename}"
@@ -201,18 +287,23 @@ class PrusaLinkClient:
         # Debug logging for upload details
         logger.info(f"Upload URL: {url}")
         logger.info(f"Upload headers: {headers}")
-        logger.info(f"File size: {len(file_content)} bytes")
+        logger.info(f"File size: {file_size} bytes")
         logger.info(f"Storage: {storage}")
         logger.info(f"Remote filename: {remote_filename}")
 
         try:
-            response = requests.put(
-                url,
-                data=file_content,
-                headers=headers,
-                auth=self.auth,
-                timeout=self.timeout,
-            )
+            body = gcode_stream
+            if progress_callback is not None:
+                body = _ProgressReader(gcode_stream, file_size, progress_callback)
+
+            with gcode_stream:
+                response = self.session.put(
+                    url,
+                    data=body,
+                    headers=headers,
+                    auth=self.auth,
+                    timeout=self.timeout,
+                )
 
             # Log response details
             logger.info(f"Response status: {response.status_code}")
@@ -258,7 +349,7 @@ class PrusaLinkClient:
             Dictionary containing printer status information.
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/v1/status", auth=self.auth, timeout=self.timeout
             )
 
@@ -300,7 +391,7 @@ class PrusaLinkClient:
             Dictionary containing job information, or None if no job running.
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/v1/job", auth=self.auth, timeout=self.timeout
             )
 
@@ -395,10 +486,8 @@ class PrusaLinkClient:
             True if file was deleted successfully
         """
         try:
-            import requests
-
             url = f"{self.base_url}/api/v1/files/{storage}/{filename}"
-            response = requests.delete(url, auth=self.auth, timeout=self.timeout)
+            response = self.session.delete(url, auth=self.auth, timeout=self.timeout)
 
             # 204 = successfully deleted, 404 = file not found (already gone)
             return response.status_code in [204, 404]
@@ -431,10 +520,6 @@ class PrusaLinkClient:
             PrusaLinkConnectionError: If connection fails
         """
         try:
-            import os
-            import tempfile
-            import time
-
             # First, wait for printer to be ready
             if not self.wait_for_printer_ready(timeout_seconds=300):
                 raise PrusaLinkConnectionError(
@@ -461,25 +546,16 @@ class PrusaLinkClient:
 
             temp_filename = f"{job_name}_{int(time.time())}.gcode"
 
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".gcode", delete=False
-            ) as f:
-                f.write(gcode_content)
-                temp_file_path = f.name
-
             try:
-                # Upload and auto-start the G-code
+                # Upload and auto-start the G-code straight from memory
                 result = self.upload_gcode(
-                    gcode_path=temp_file_path,
+                    gcode_path=gcode_content.encode(),
                     storage="local",  # Use local storage since USB not available
                     remote_filename=temp_filename,
                     auto_start=True,
                     overwrite=True,
                 )
 
-                # Clean up local temp file
-                os.unlink(temp_file_path)
-
                 if not (result and result.get("status") == "success"):
                     raise PrusaLinkConnectionError(f"G-code upload failed: {result}")
 
@@ -503,9 +579,6 @@ class PrusaLinkClient:
                 return True
 
             except Exception as e:
-                # Clean up local temp file on error
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
                 # Try to clean up remote file too (unless keeping)
                 if not keep_temp_file:
                     self.delete_file(temp_filename, storage="local")
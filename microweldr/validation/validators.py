@@ -1,5 +1,6 @@
 """Validation functionality for SVG and G-code files."""
 
+from functools import lru_cache
 from pathlib import Path
 
 # Optional validation libraries
@@ -18,6 +19,10 @@ except ImportError:
     GCODEPARSER_AVAILABLE = False
 
 
+# Bytes read from the start of a file to reject empty files before parsing
+SVG_SNIFF_BYTES = 4096
+
+
 class ValidationError(Exception):
     """Raised when validation fails."""
 
@@ -27,6 +32,8 @@ class ValidationError(Exception):
 class ValidationResult:
     """Result of a validation operation."""
 
+    __slots__ = ("is_valid", "message", "warnings")
+
     def __init__(self, is_valid: bool, message: str, warnings: list[str] | None = None):
         self.is_valid = is_valid
         self.message = message
@@ -36,14 +43,52 @@ class ValidationResult:
         return self.is_valid
 
 
+@lru_cache(maxsize=128)
+def _cached_svg_validation(
+    path_str: str, mtime_ns: int, size: int
+) -> tuple[bool, str, tuple[str, ...]]:
+    """Validate an SVG file once per (path, mtime, size) snapshot.
+
+    The modification time and size are only part of the cache key so that an
+    edited file is validated again; they are not used otherwise.
+    """
+    result = SVGValidator._validate_uncached(Path(path_str))
+    return result.is_valid, result.message, tuple(result.warnings)
+
+
 class SVGValidator:
     """Validator for SVG files."""
 
     @staticmethod
     def validate(svg_path: str | Path) -> ValidationResult:
-        """Validate SVG file structure and syntax."""
+        """Validate SVG file structure and syntax.
+
+        Results are cached by resolved path, modification time and size, so
+        repeated validation of an unchanged file does not re-parse it.
+        """
         svg_path = Path(svg_path)
 
+        try:
+            resolved = svg_path.resolve()
+            stat = resolved.stat()
+        except OSError:
+            return SVGValidator._validate_uncached(svg_path)
+
+        is_valid, message, warnings = _cached_svg_validation(
+            str(resolved), stat.st_mtime_ns, stat.st_size
+        )
+        return ValidationResult(
+            is_valid=is_valid, message=message, warnings=list(warnings)
+        )
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Discard cached SVG validation results."""
+        _cached_svg_validation.cache_clear()
+
+    @staticmethod
+    def _validate_uncached(svg_path: Path) -> ValidationResult:
+        """Parse and validate an SVG file without consulting the cache."""
         if not LXML_AVAILABLE:
             return ValidationResult(
                 is_valid=True,
@@ -52,8 +97,18 @@ class SVGValidator:
             )
 
         try:
-            # Parse with lxml for better validation
             with open(svg_path, "rb") as f:
+                # Empty files are rejected without building a document tree;
+                # anything else goes to the parser, since the <svg> element may
+                # follow a long prolog or use a non-ASCII-compatible encoding
+                head = f.read(SVG_SNIFF_BYTES)
+                if not head.strip():
+                    return ValidationResult(
+                        is_valid=False, message=f"SVG file is empty: {svg_path}"
+                    )
+
+                # Parse with lxml for better validation
+                f.seek(0)
                 doc = etree.parse(f)  # nosec B320 - Parsing trusted user SVG files
 
             # Basic SVG structure validation
@@ -120,8 +175,9 @@ class GCodeValidator:
             has_movement = False
 
             for line in lines:
-                if hasattr(line, "command") and line.command:
-                    cmd_letter, cmd_number = line.command
+                command = getattr(line, "command", None)
+                if command:
+                    cmd_letter, cmd_number = command
 
                     if cmd_letter == "G":
                         if cmd_number == 28:  # Home
@@ -182,8 +238,9 @@ class GCodeValidator:
             has_movement = False
 
             for line in lines:
-                if hasattr(line, "command") and line.command:
-                    cmd_letter, cmd_number = line.command
+                command = getattr(line, "command", None)
+                if command:
+                    cmd_letter, cmd_number = command
 
                     if cmd_letter == "G":
                         if cmd_number == 28:  # Home
@@ -5,8 +5,14 @@ Tests for the streaming G-code subscriber functionality.
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from microweldr.core.config import Config
-from microweldr.outputs.streaming_gcode_subscriber import StreamingGCodeSubscriber
+from microweldr.outputs.streaming_gcode_subscriber import (
+    FilenameError,
+    StreamingGCodeSubscriber,
+    validate_gcode_filename,
+)
 
 
 class TestStreamingGCodeSubscriber:
@@ -37,3 +43,10 @@ class TestStreamingGCodeSubscriber:
         finally:
             if output_path.exists():
                 output_path.unlink()
+
+    def test_validate_gcode_filename(self):
+        """Test the Prusa filename length limit is checked on the name only."""
+        validate_gcode_filename(Path("/a/long/directory/name/part1.gcode"))
+
+        with pytest.raises(FilenameError, match="31 character limit"):
+            validate_gcode_filename("a_filename_well_over_the_limit.gcode")
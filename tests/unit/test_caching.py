@@ -0,0 +1,60 @@
+"""Tests for caching utilities."""
+
+from pathlib import Path
+
+import pytest
+
+from microweldr.core import caching
+from microweldr.core.caching import OptimizedSVGParser
+
+EXAMPLE_SVG = Path(__file__).parents[2] / "examples" / "flask_simple.svg"
+
+
+@pytest.fixture
+def slow_clock(monkeypatch):
+    """Make every parse look slower than the 1 ms caching threshold."""
+    ticks = iter(range(0, 10**6, 10))
+    monkeypatch.setattr(caching.time, "perf_counter", lambda: next(ticks) / 1000)
+
+
+class TestOptimizedSVGParser:
+    """Test the cached SVG parser."""
+
+    def test_repeat_parse_hits_cache(self, tmp_path, monkeypatch, slow_clock):
+        """Test that parsing the same content twice is served from the cache."""
+        monkeypatch.chdir(tmp_path)
+
+        first = OptimizedSVGParser(dot_spacing=1.5)
+        second = OptimizedSVGParser(dot_spacing=1.5)
+        paths = first.parse_svg_file(EXAMPLE_SVG)
+        cached = second.parse_svg_file(EXAMPLE_SVG)
+
+        assert second.get_stats()["cache_hits"] == 1
+        assert [len(p.points) for p in cached] == [len(p.points) for p in paths]
+
+    def test_dot_spacing_is_part_of_cache_key(self, tmp_path, monkeypatch):
+        """Test that a different dot spacing does not reuse cached paths."""
+        monkeypatch.chdir(tmp_path)
+
+        OptimizedSVGParser(dot_spacing=1.5).parse_svg_file(EXAMPLE_SVG)
+        parser = OptimizedSVGParser(dot_spacing=3.0)
+        parser.parse_svg_file(EXAMPLE_SVG)
+
+        assert parser.get_stats()["cache_hits"] == 0
+
+    def test_unchanged_file_served_without_reading(
+        self, tmp_path, monkeypatch, slow_clock
+    ):
+        """Test that an unchanged file hits the cache before its content is read."""
+        monkeypatch.chdir(tmp_path)
+        svg_path = tmp_path / "flask.svg"
+        svg_path.write_bytes(EXAMPLE_SVG.read_bytes())
+        paths = OptimizedSVGParser().parse_svg_file(svg_path)
+
+        def fail_read(*args, **kwargs):
+            raise AssertionError("file content should not be read on a stat hit")
+
+        monkeypatch.setattr(Path, "read_text", fail_read)
+        cached = OptimizedSVGParser().parse_svg_file(svg_path)
+
+        assert [len(p.points) for p in cached] == [len(p.points) for p in paths]
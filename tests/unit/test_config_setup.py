@@ -0,0 +1,116 @@
+"""Tests for configuration setup commands."""
+
+import datetime
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from microweldr.cli.config_setup import _format_json, _sanitize_config, config
+
+
+class TestSanitizeConfig:
+    """Test hiding sensitive values before display."""
+
+    def test_sensitive_keys_hidden_at_any_depth(self):
+        """Test that credential-like keys are hidden in nested sections."""
+        config_data = {
+            "prusalink": {
+                "host": "192.168.1.10",
+                "password": "hunter2",
+                "API_KEY": "abc",
+                "auth": {"bearer_token": "xyz"},
+            },
+            "client_secret": "s3cret",
+        }
+
+        safe_config = _sanitize_config(config_data)
+
+        assert safe_config["prusalink"]["host"] == "192.168.1.10"
+        assert safe_config["prusalink"]["password"] == "[HIDDEN]"
+        assert safe_config["prusalink"]["API_KEY"] == "[HIDDEN]"
+        assert safe_config["prusalink"]["auth"]["bearer_token"] == "[HIDDEN]"
+        assert safe_config["client_secret"] == "[HIDDEN]"
+        assert config_data["prusalink"]["password"] == "hunter2"
+
+    def test_sections_without_secrets_are_shared(self):
+        """Test that untouched sections are reused instead of copied."""
+        printer = {"host": "192.168.1.10", "model": "core_one"}
+        config_data = {"printer": printer, "prusalink": {"password": "hunter2"}}
+
+        safe_config = _sanitize_config(config_data)
+
+        assert safe_config["printer"] is printer
+        assert safe_config["prusalink"] == {"password": "[HIDDEN]"}
+        assert _sanitize_config(printer) is printer
+
+    def test_deeply_nested_config(self):
+        """Test that nesting deeper than the recursion limit is handled."""
+        config_data = leaf = {}
+        for _ in range(5000):
+            leaf["nested"] = {}
+            leaf = leaf["nested"]
+        leaf["token"] = "abc"
+
+        safe_config = _sanitize_config(config_data)
+
+        for _ in range(5000):
+            safe_config = safe_config["nested"]
+        assert safe_config == {"token": "[HIDDEN]"}
+        assert leaf["token"] == "abc"
+
+
+# Values whose encoding differs between json and orjson unless normalized
+DISPLAY_CONFIG = {
+    "printer": {"host": "printer.local", "location": "Zürich lab"},
+    "maintenance": {
+        "last_service": datetime.datetime(2024, 5, 27, 7, 32),
+        "next_service": datetime.date(2025, 5, 27),
+    },
+}
+DISPLAY_JSON = """{
+  "printer": {
+    "host": "printer.local",
+    "location": "Zürich lab"
+  },
+  "maintenance": {
+    "last_service": "2024-05-27T07:32:00",
+    "next_service": "2025-05-27"
+  }
+}"""
+
+
+class TestFormatJson:
+    """Test JSON formatting for config display."""
+
+    def test_standard_library_encoder(self, monkeypatch):
+        """Test the fallback output when orjson is not installed."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        assert _format_json(DISPLAY_CONFIG) == DISPLAY_JSON
+
+    def test_orjson_encoder(self):
+        """Test that orjson, when installed, gives identical output."""
+        pytest.importorskip("orjson")
+
+        assert _format_json(DISPLAY_CONFIG) == DISPLAY_JSON
+
+
+class TestShowCommand:
+    """Test the config show command."""
+
+    def test_show_lists_sources_and_hides_secrets(self, tmp_path, monkeypatch):
+        """Test that show reports the loaded file with credentials hidden."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        (tmp_path / "microweldr_secrets.toml").write_text(
+            '[prusalink]\nhost = "192.168.1.10"\npassword = "hunter2"\n'
+        )
+
+        result = CliRunner().invoke(config, ["show"])
+
+        assert result.exit_code == 0
+        assert "Configuration Sources (in load order):\n  1. " in result.output
+        assert "\nMerged Configuration:\n" in result.output
+        assert '"password": "[HIDDEN]"' in result.output
+        assert "hunter2" not in result.output
@@ -0,0 +1,83 @@
+"""Tests for the enhanced command-line interface."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from microweldr.cli.enhanced_main import cli
+from microweldr.core import caching
+from microweldr.core.unified_config import reset_unified_config
+
+SIMPLE_SVG = """<?xml version="1.0" encoding="UTF-8"?>
+<svg width="100" height="100" xmlns="http://www.w3.org/2000/svg">
+  <line id="line1" x1="10" y1="20" x2="30" y2="40" stroke="black"/>
+</svg>"""
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in an empty directory so the default configuration banner prints."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    reset_unified_config()
+    (tmp_path / "config.toml").write_text("")
+    (tmp_path / "design.svg").write_text(SIMPLE_SVG)
+    yield tmp_path
+    reset_unified_config()
+
+
+@pytest.fixture
+def passing_safety_check(monkeypatch):
+    """Report no safety warnings or errors for any weld paths."""
+    monkeypatch.setattr(
+        "microweldr.core.safety.validate_weld_operation",
+        lambda paths, config, fail_fast=False: ([], []),
+    )
+
+
+class TestValidateJson:
+    """Test the machine-readable output of the validate command."""
+
+    def test_success_output_is_only_json(self, workdir, passing_safety_check):
+        """Test that a passing validation writes a single JSON record."""
+        result = CliRunner().invoke(cli, ["validate", "--json", "design.svg"])
+
+        assert result.exit_code == 0
+        record = json.loads(result.stdout)
+        assert record["valid"] is True
+        assert record["paths"] == 1
+
+    def test_failure_output_is_only_json(self, workdir, monkeypatch):
+        """Test that a failing validation still writes only JSON to stdout."""
+        monkeypatch.setattr(
+            "microweldr.core.safety.validate_weld_operation",
+            lambda paths, config, fail_fast=False: ([], ["Temperature too high"]),
+        )
+
+        result = CliRunner().invoke(cli, ["validate", "--json", "design.svg"])
+
+        assert result.exit_code == 1
+        record = json.loads(result.stdout)
+        assert record["valid"] is False
+        assert record["errors"] == ["Temperature too high"]
+
+
+class TestValidateThenWeld:
+    """Test that validate and weld share the SVG parse cache."""
+
+    def test_weld_reuses_parse_from_validate(
+        self, workdir, passing_safety_check, monkeypatch
+    ):
+        """Test that weld is served from the cache validate filled."""
+        # Make the parse look slower than the cache's 1 ms store threshold
+        ticks = iter(range(0, 10**6, 10))
+        monkeypatch.setattr(caching.time, "perf_counter", lambda: next(ticks) / 1000)
+        runner = CliRunner()
+
+        validated = runner.invoke(cli, ["validate", "design.svg"])
+        welded = runner.invoke(cli, ["weld", "design.svg", "--validate-only"])
+
+        assert validated.exit_code == 0
+        assert welded.exit_code == 0
+        assert "Cache hit rate: 100.0%" in welded.output
@@ -142,6 +142,17 @@ class TestErrorCollector:
         assert collector.has_errors()
         assert len(collector.errors) == 2
 
+    def test_iter_errors(self):
+        """Test lazily iterating over error messages."""
+        collector = ErrorCollector()
+        collector.add_error("First error")
+        collector.add_error(ValidationError("Second error"))
+
+        errors = collector.iter_errors()
+
+        assert next(errors) == "First error"
+        assert list(errors) == ["Second error"]
+
     def test_add_warnings(self):
         """Test adding warnings."""
         collector = ErrorCollector()
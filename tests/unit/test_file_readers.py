@@ -0,0 +1,25 @@
+"""Tests for the multi-file reader registry."""
+
+from pathlib import Path
+
+from microweldr.parsers.dxf_reader import DXFReader
+from microweldr.parsers.file_readers import MultiFileReader
+from microweldr.parsers.svg_reader import SVGReader
+
+
+class TestMultiFileReader:
+    """Test routing files to registered readers."""
+
+    def test_get_reader_for_file_by_extension(self):
+        """Test that files route to the first reader registered for their suffix."""
+        multi_reader = MultiFileReader()
+        svg_reader = SVGReader()
+        dxf_reader = DXFReader()
+        multi_reader.register_reader(svg_reader)
+        multi_reader.register_reader(dxf_reader)
+        multi_reader.register_reader(SVGReader())
+
+        assert multi_reader.get_reader_for_file(Path("part.svg")) is svg_reader
+        assert multi_reader.get_reader_for_file(Path("PART.SVG")) is svg_reader
+        assert multi_reader.get_reader_for_file(Path("part.dxf")) is dxf_reader
+        assert multi_reader.get_reader_for_file(Path("part.txt")) is None
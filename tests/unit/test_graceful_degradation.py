@@ -0,0 +1,50 @@
+"""Tests for graceful degradation utilities."""
+
+from unittest.mock import MagicMock
+
+from microweldr.core.graceful_degradation import ResilientPrusaLinkClient
+
+
+class TestResilientPrusaLinkClient:
+    """Test ResilientPrusaLinkClient status handling."""
+
+    def _make_client(self, status_ttl=60.0):
+        """Create a resilient client backed by a mocked PrusaLink client."""
+        resilient = ResilientPrusaLinkClient(status_ttl=status_ttl)
+        mock_client = MagicMock()
+        mock_client.get_printer_status.return_value = {
+            "printer": {"state": "Operational"}
+        }
+        resilient._client = mock_client
+        resilient._last_health_check = float("inf")
+        return resilient, mock_client
+
+    def test_get_status_reuses_recent_response(self):
+        """Test repeated status reads share one request within the TTL."""
+        resilient, mock_client = self._make_client()
+
+        first = resilient.get_status()
+        second = resilient.get_status()
+
+        assert first == second == {"printer": {"state": "Operational"}}
+        assert mock_client.get_printer_status.call_count == 1
+
+    def test_get_status_without_ttl_always_fetches(self):
+        """Test a zero TTL disables status reuse."""
+        resilient, mock_client = self._make_client(status_ttl=0.0)
+
+        resilient.get_status()
+        resilient.get_status()
+
+        assert mock_client.get_printer_status.call_count == 2
+
+    def test_stop_print_invalidates_cached_status(self):
+        """Test printer commands drop the cached status."""
+        resilient, mock_client = self._make_client()
+        mock_client.stop_print.return_value = {"stopped": True}
+
+        resilient.get_status()
+        resilient.stop_print()
+        resilient.get_status()
+
+        assert mock_client.get_printer_status.call_count == 2
@@ -137,6 +137,20 @@ class TestWeldPath:
         bounds = path.get_bounds()
         assert bounds == (0.0, 0.0, 0.0, 0.0)
 
+    def test_get_total_length(self):
+        """Test total length sums every segment of the path."""
+        points = [
+            WeldPoint(x=0.0, y=0.0, weld_type="normal"),
+            WeldPoint(x=3.0, y=4.0, weld_type="normal"),
+            WeldPoint(x=3.0, y=10.0, weld_type="normal"),
+        ]
+        path = WeldPath(points=points, weld_type="normal", svg_id="test")
+
+        assert path.get_total_length() == pytest.approx(11.0)
+
+        single = WeldPath(points=points[:1], weld_type="normal", svg_id="single")
+        assert single.get_total_length() == 0.0
+
     def test_weld_path_type_enum(self):
         """Test weld path type enum property."""
         from microweldr.core.constants import WeldType
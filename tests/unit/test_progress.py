@@ -0,0 +1,33 @@
+"""Tests for progress reporting utilities."""
+
+import io
+
+from microweldr.core.progress import ProgressReporter
+
+
+class TestProgressReporter:
+    """Test ProgressReporter rendering."""
+
+    def test_rapid_updates_are_coalesced(self):
+        """Test that a burst of updates renders far fewer frames than updates."""
+        output = io.StringIO()
+        reporter = ProgressReporter(1000, "Welding", file=output)
+
+        for _ in range(999):
+            reporter.update(1)
+        frames_before_finish = output.getvalue().count("Welding:")
+        reporter.finish()
+
+        assert 1 <= frames_before_finish < 50
+        assert output.getvalue().rstrip().endswith("| Complete")
+        assert reporter.current == reporter.total
+
+    def test_set_progress_is_throttled(self):
+        """Test that absolute progress updates share the render throttle."""
+        output = io.StringIO()
+        reporter = ProgressReporter(100, "Welding", file=output)
+
+        for value in range(1, 50):
+            reporter.set_progress(value)
+
+        assert output.getvalue().count("Welding:") < 10
@@ -1,11 +1,16 @@
 """Tests for PrusaLink client functionality."""
 
+import io
+import re
 import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
 import pytest
+import requests
 
-from microweldr.prusalink.client import PrusaLinkClient
+from microweldr.prusalink.client import PrusaLinkClient, _ProgressReader
 from microweldr.prusalink.exceptions import PrusaLinkConfigError, PrusaLinkError
 
 
@@ -131,3 +136,140 @@ password = "test123"
 
         result = client.is_printer_ready()
         assert result is True
+
+    def test_upload_gcode_streams_file(self, requests_mock, client, tmp_path):
+        """Test upload_gcode streams the file with an explicit Content-Length."""
+        gcode_file = tmp_path / "weld.gcode"
+        gcode_file.write_text("G28\nG1 X10 Y10\n")
+
+        requests_mock.put(
+            "http://192.168.1.100/api/v1/files/local/weld.gcode", status_code=201
+        )
+
+        result = client.upload_gcode(str(gcode_file))
+
+        assert result["status"] == "success"
+        request = requests_mock.last_request
+        assert request.headers["Content-Length"] == str(gcode_file.stat().st_size)
+
+    def test_upload_gcode_from_bytes(self, requests_mock, client):
+        """Test upload_gcode sends in-memory G-code without a local file."""
+        gcode = b"M140 S0\nM104 S0\n"
+        requests_mock.put(
+            "http://192.168.1.100/api/v1/files/local/cooldown.gcode", status_code=201
+        )
+
+        result = client.upload_gcode(gcode, remote_filename="cooldown.gcode")
+
+        assert result["filename"] == "cooldown.gcode"
+        request = requests_mock.last_request
+        assert request.headers["Content-Length"] == str(len(gcode))
+
+        with pytest.raises(PrusaLinkError, match="remote filename"):
+            client.upload_gcode(gcode)
+
+    def test_requests_share_one_session(self, requests_mock, client):
+        """Test that calls reuse one HTTP session until the client is closed."""
+        requests_mock.get("http://192.168.1.100/api/v1/status", json={})
+
+        client.get_printer_status()
+        session = client.session
+        client.get_printer_status()
+
+        assert client.session is session
+        client.close()
+        assert client.session is not session
+
+    def test_session_without_init(self):
+        """Test that clients assembled without __init__ still get a session."""
+        client = object.__new__(PrusaLinkClient)
+
+        assert client.session is client.session
+
+    def test_send_and_run_gcode_uploads_from_memory(
+        self, requests_mock, client, monkeypatch
+    ):
+        """Test that ad-hoc commands are uploaded without a local temp file."""
+        monkeypatch.setattr(client, "wait_for_printer_ready", lambda **_: True)
+        monkeypatch.setattr(
+            "tempfile.NamedTemporaryFile",
+            lambda *a, **k: pytest.fail("no temporary file expected"),
+        )
+        requests_mock.put(re.compile(r"/api/v1/files/local/"), status_code=201)
+
+        assert client.send_and_run_gcode(["M140 S0"], wait_for_completion=False)
+        assert requests_mock.last_request.path.startswith(
+            "/api/v1/files/local/temp_gcode_"
+        )
+
+
+class TestProgressReader:
+    """Test upload progress reporting."""
+
+    def test_reports_each_chunk_and_keeps_length(self):
+        """Test that reads are counted and the body length stays known."""
+        seen = []
+        reader = _ProgressReader(io.BytesIO(b"x" * 20000), 20000, seen.append)
+
+        assert requests.utils.super_len(reader) == 20000
+        assert b"".join(reader) == b"x" * 20000
+        assert seen == [8192, 8192, 3616]
+
+    def test_rewind_is_not_counted_twice(self):
+        """Test that re-reading after seek() only reports new bytes."""
+        seen = []
+        reader = _ProgressReader(io.BytesIO(b"x" * 100), 100, seen.append)
+
+        reader.read(60)
+        reader.seek(0)
+        assert reader.tell() == 0
+        assert reader.read() == b"x" * 100
+        assert seen == [60, 40]
+
+    def test_upload_resent_after_digest_challenge(self, tmp_path):
+        """Test that the whole body is re-sent after a 401 digest challenge."""
+        received = []
+
+        class DigestHandler(BaseHTTPRequestHandler):
+            def do_PUT(self):
+                length = int(self.headers["Content-Length"])
+                received.append(len(self.rfile.read(length)))
+                if "Authorization" not in self.headers:
+                    self.send_response(401)
+                    self.send_header(
+                        "WWW-Authenticate",
+                        'Digest realm="Printer API", nonce="abc", qop="auth"',
+                    )
+                else:
+                    self.send_response(201)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), DigestHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            secrets = tmp_path / "secrets.toml"
+            secrets.write_text(
+                f'[prusalink]\nhost = "127.0.0.1:{server.server_port}"\n'
+                'username = "maker"\npassword = "test123"\ntimeout = 5\n'
+            )
+            gcode = tmp_path / "weld.gcode"
+            gcode.write_bytes(b"G1 X1\n" * 5000)
+            seen = []
+
+            with PrusaLinkClient(str(secrets)) as client:
+                result = client.upload_gcode(
+                    str(gcode), storage="local", progress_callback=seen.append
+                )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        size = gcode.stat().st_size
+        assert result["response_code"] == 201
+        assert received == [size, size]
+        assert sum(seen) == size
@@ -0,0 +1,35 @@
+"""Tests for safety validation."""
+
+from microweldr.core.safety import validate_weld_operation
+
+
+class TestValidateWeldOperation:
+    """Test validate_weld_operation result accumulation."""
+
+    def test_config_warnings_reported_once(self):
+        """Test that configuration warnings are not duplicated in the result."""
+        config = {"normal_welds": {"weld_temperature": 40.0}}
+
+        warnings, errors = validate_weld_operation([], config)
+
+        assert errors == []
+        assert len(warnings) == 1
+        assert "normal_welds.weld_temperature" in warnings[0]
+
+    def test_config_errors_reported(self):
+        """Test that configuration errors are returned."""
+        config = {"temperatures": {"bed_temperature": 200.0}}
+
+        _, errors = validate_weld_operation([], config)
+
+        assert len(errors) == 1
+        assert "bed_temperature" in errors[0]
+
+    def test_fail_fast_skips_paths_after_error(self):
+        """Test that fail_fast stops before checking paths once invalid."""
+        config = {"temperatures": {"bed_temperature": 200.0}}
+        unchecked_path = object()  # would raise if it were validated
+
+        _, errors = validate_weld_operation([unchecked_path], config, fail_fast=True)
+
+        assert len(errors) == 1
@@ -0,0 +1,31 @@
+"""Tests for event processing subscribers."""
+
+import time
+
+from microweldr.core.events import Event, EventType
+from microweldr.processors.subscribers import ValidationSubscriber
+
+
+class TestValidationSubscriber:
+    """Test validation results reporting."""
+
+    def test_results_survive_reset(self):
+        """Test that results kept by the caller are unaffected by reset()."""
+        subscriber = ValidationSubscriber()
+        subscriber.handle_event(
+            Event(
+                EventType.PATH_PROCESSING,
+                time.time(),
+                {
+                    "action": "path_start",
+                    "path_data": {"id": "line1", "weld_type": "normal"},
+                },
+            )
+        )
+
+        results = subscriber.get_validation_results()
+        subscriber.reset()
+
+        assert results["total_paths"] == 1
+        assert list(results["path_stats"]) == ["line1"]
+        assert subscriber.get_validation_results()["path_stats"] == {}
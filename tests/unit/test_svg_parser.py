@@ -181,6 +181,29 @@ class TestSVGParser:
         finally:
             svg_path.unlink()
 
+    def test_parse_string_matches_parse_file(self):
+        """Test that parsing in-memory markup matches parsing the file."""
+        svg_content = """<?xml version="1.0" encoding="UTF-8"?>
+<svg width="100" height="100" xmlns="http://www.w3.org/2000/svg">
+  <line id="line1" x1="10" y1="20" x2="30" y2="40" stroke="black"/>
+</svg>"""
+
+        svg_path = self.create_temp_svg(svg_content)
+        try:
+            parser = SVGParser(dot_spacing=5.0)
+            from_file = parser.parse_file(str(svg_path))
+            from_string = parser.parse_string(svg_content)
+
+            assert [p.svg_id for p in from_string] == [p.svg_id for p in from_file]
+            assert [len(p.points) for p in from_string] == [
+                len(p.points) for p in from_file
+            ]
+        finally:
+            svg_path.unlink()
+
+        with pytest.raises(SVGParseError, match="Invalid SVG file"):
+            parser.parse_string("This is not valid XML")
+
     def test_missing_file_raises_error(self):
         """Test that missing file raises SVGParseError."""
         parser = SVGParser()
@@ -0,0 +1,75 @@
+"""Tests for temperature control helpers."""
+
+import pytest
+
+from microweldr.cli import temperature_control
+from microweldr.cli.temperature_control import wait_for_temperatures
+from microweldr.prusalink.client import PrusaLinkClient
+
+STATUS_URL = "http://192.168.1.100/api/v1/status"
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Create a PrusaLink client for a mocked printer."""
+    secrets = tmp_path / "secrets.toml"
+    secrets.write_text(
+        '[prusalink]\nhost = "192.168.1.100"\nusername = "maker"\n'
+        'password = "test123"\n'
+    )
+    return PrusaLinkClient(str(secrets))
+
+
+def serve_readings(requests_mock, readings):
+    """Answer successive status requests with (bed, nozzle) readings."""
+    requests_mock.get(
+        STATUS_URL,
+        [
+            {"json": {"printer": {"temp_bed": bed, "temp_nozzle": nozzle}}}
+            for bed, nozzle in readings
+        ],
+    )
+
+
+class TestWaitForTemperatures:
+    """Test adaptive heat-up polling."""
+
+    def test_polls_faster_near_target(self, monkeypatch, requests_mock, client):
+        """Test that the poll interval shrinks as temperatures converge."""
+        sleeps = []
+        monkeypatch.setattr(temperature_control.time, "sleep", sleeps.append)
+        serve_readings(requests_mock, [(20, 20), (50, 150), (57, 157), (59, 159)])
+
+        assert wait_for_temperatures(client, 60, 160) is True
+        assert sleeps == [5.0, 2.0, 0.5]
+
+    def test_reached_on_first_reading_without_sleeping(
+        self, monkeypatch, requests_mock, client
+    ):
+        """Test that an already-hot printer returns without waiting."""
+        sleeps = []
+        monkeypatch.setattr(temperature_control.time, "sleep", sleeps.append)
+        serve_readings(requests_mock, [(60, 161)])
+
+        assert wait_for_temperatures(client, 60, 160) is True
+        assert sleeps == []
+        assert requests_mock.call_count == 1
+
+    def test_status_lines_throttled(self, monkeypatch, capsys, requests_mock, client):
+        """Test that fast polls print only the first and final readings."""
+        monkeypatch.setattr(temperature_control.time, "sleep", lambda _: None)
+        serve_readings(
+            requests_mock, [(57, 157), (57.5, 157.5), (58, 157), (59.2, 159.1)]
+        )
+
+        assert wait_for_temperatures(client, 60, 160) is True
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 2
+        assert "59.2°C/60°C" in lines[-1]
+
+    def test_timeout(self, monkeypatch, requests_mock, client):
+        """Test that polling stops once the timeout has passed."""
+        monkeypatch.setattr(temperature_control.time, "sleep", lambda _: None)
+        serve_readings(requests_mock, [(20, 20)])
+
+        assert wait_for_temperatures(client, 60, 160, 0) is False
@@ -125,6 +125,62 @@ class TestSVGValidator:
         finally:
             Path(svg_path).unlink()
 
+    def test_empty_and_non_svg_files_rejected(self):
+        """Test that empty and non-SVG files are rejected without parsing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            empty_path = Path(temp_dir) / "empty.svg"
+            empty_path.write_text("")
+            text_path = Path(temp_dir) / "notes.svg"
+            text_path.write_text("just some text\n")
+
+            empty_result = SVGValidator.validate(empty_path)
+            text_result = SVGValidator.validate(text_path)
+
+            assert empty_result.is_valid is False
+            assert "empty" in empty_result.message.lower()
+            assert text_result.is_valid is False
+
+    def test_svg_after_long_prolog_accepted(self):
+        """Test that an <svg> element beyond the first few KiB is still found."""
+        svg_content = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f"<!-- {'x' * 8192} -->\n"
+            '<svg width="10" height="10" xmlns="http://www.w3.org/2000/svg"/>'
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            svg_path = Path(temp_dir) / "commented.svg"
+            svg_path.write_text(svg_content)
+
+            assert SVGValidator.validate(svg_path).is_valid is True
+
+    def test_utf16_svg_accepted(self):
+        """Test that a UTF-16 encoded SVG is validated by the parser."""
+        svg_content = (
+            '<?xml version="1.0" encoding="UTF-16"?>\n'
+            '<svg width="10" height="10" xmlns="http://www.w3.org/2000/svg"/>'
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            svg_path = Path(temp_dir) / "utf16.svg"
+            svg_path.write_text(svg_content, encoding="utf-16")
+
+            assert SVGValidator.validate(svg_path).is_valid is True
+
+    def test_cached_result_invalidated_on_change(self):
+        """Test that editing a file invalidates its cached validation result."""
+        valid_svg = '<svg width="10" height="10" xmlns="http://www.w3.org/2000/svg"/>'
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            svg_path = Path(temp_dir) / "cached.svg"
+            svg_path.write_text(valid_svg)
+
+            assert SVGValidator.validate(svg_path).is_valid is True
+            assert SVGValidator.validate(svg_path).is_valid is True
+
+            svg_path.write_text(valid_svg + "<broken")
+            assert SVGValidator.validate(svg_path).is_valid is False
+
 
 class TestGCodeValidator:
     """Test G-code validation functionality."""